@@ -1,2 +1,2 @@
-from .runner import hpo, R, M, C, Skip
+from .runner import hpo, R, M, C, Skip, Prune
 from .value.funcs import *
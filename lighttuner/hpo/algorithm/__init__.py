@@ -1,4 +1,7 @@
 from .base import BaseAlgorithm, BaseSession, BaseConfigure, OptimizeDirection, Task
 from .bayes import BayesSession, BayesAlgorithm, BayesConfigure
 from .grid import GridSession, GridAlgorithm, GridConfigure
+from .hyperband import HyperbandSession, HyperbandAlgorithm, HyperbandConfigure, BOHBSession, BOHBAlgorithm, \
+    BOHBConfigure
 from .random import RandomSession, RandomAlgorithm, RandomConfigure
+from .tpe import TPESession, TPEAlgorithm, TPEConfigure
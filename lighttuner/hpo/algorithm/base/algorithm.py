@@ -1,11 +1,12 @@
 from enum import IntEnum, unique
 from threading import Thread, Lock
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, Dict
 
 import inflection
 
 from .model import Task
 from ...utils import ThreadService, Result
+from ...utils.service import ServiceState
 from ...value import struct_values, HyperValue
 
 
@@ -66,6 +67,17 @@ class BaseSession:
     def _return(self, task: Task, result: Result):
         pass
 
+    def trial_args(self, task: Task) -> Dict[str, Any]:
+        """
+        Extra arguments of the black-box function for this task, which are passed by name \
+        (such as ``budget``). Default is empty.
+        """
+        return {}
+
+    @property
+    def _service_dead(self) -> bool:
+        return self.__service.state == ServiceState.DEAD
+
     def _return_on_success(self, task: Task, retval: Any):
         raise NotImplementedError  # pragma: no cover
 
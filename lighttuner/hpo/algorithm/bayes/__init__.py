@@ -1,3 +1,4 @@
 from .algorithm import BayesAlgorithm, BayesSession, BayesConfigure
 from .allocation import hyper_to_bound
+from .gp import IncrementalGaussianProcess, WindowedGaussianProcess
 from .utils import acq_max, UtilityFunction, ensure_rng
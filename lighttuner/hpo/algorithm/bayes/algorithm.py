@@ -1,6 +1,5 @@
-import warnings
-from queue import Queue
-from threading import Lock, Event
+from itertools import count
+from threading import Lock, Event, Condition, Thread
 from typing import Dict, Any, Tuple, Callable, List, Optional
 
 import numpy as np
@@ -8,9 +7,13 @@ from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import Matern
 
 from .allocation import hyper_to_bound
+from .gp import IncrementalGaussianProcess, WindowedGaussianProcess
 from .utils import ensure_rng, UtilityFunction, acq_max
 from ..base import BaseAlgorithm, OptimizeDirection, BaseConfigure, BaseSession, Task
-from ...utils import ThreadService, ServiceNoLongerAccept
+from ...utils import ThreadService, ServiceNoLongerAccept, Result
+
+_LIARS = ('min', 'mean', 'max', 'believer')
+_SURROGATES = ('exact', 'window')
 
 
 class BayesConfigure(BaseConfigure):
@@ -19,6 +22,22 @@ class BayesConfigure(BaseConfigure):
         self._settings['init_steps'] = steps
         return self
 
+    def fit_steps(self, steps: int):
+        self._settings['fit_steps'] = steps
+        return self
+
+    def async_fit(self, enabled: bool = True):
+        self._settings['async_fit'] = enabled
+        return self
+
+    def surrogate(self, kind: str = 'exact', max_size: int = ..., best_ratio: float = ...):
+        self._settings['surrogate'] = kind
+        if max_size is not Ellipsis:
+            self._settings['surrogate_size'] = max_size
+        if best_ratio is not Ellipsis:
+            self._settings['surrogate_best_ratio'] = best_ratio
+        return self
+
     def set_utils(self, acq=..., kappa=..., kappa_decay=..., kappa_decay_delay=..., xi=...):
         new_values = {
             key: value
@@ -29,6 +48,19 @@ class BayesConfigure(BaseConfigure):
         self._settings.update(new_values)
         return self
 
+    def set_acq_optimizer(self, n_warmup=..., n_iter=...):
+        new_values = {
+            key: value
+            for key, value in dict(n_warmup=n_warmup, n_iter=n_iter).items() if value is not Ellipsis
+        }
+        self._settings.update(new_values)
+        return self
+
+    def batch(self, size: int, liar: str = 'min'):
+        self._settings['batch_size'] = size
+        self._settings['liar'] = liar
+        return self
+
     def set_gp_params(self, **gp_params):
         gps = self._settings.get('gp_params', None) or {}
         gps.update(gp_params)
@@ -44,22 +76,55 @@ class BayesAlgorithm(BaseAlgorithm):
         seed: Optional[int] = None,
         max_steps: Optional[int] = None,
         init_steps: int = 5,
+        fit_steps: int = 1,
+        async_fit: bool = False,
         acq='ucb',
         kappa=2.576,
         kappa_decay=1,
         kappa_decay_delay=0,
         xi=0.0,
+        n_warmup: int = 10000,
+        n_iter: int = 10,
         gp_params: Optional[Dict] = None,
+        surrogate: str = 'exact',
+        surrogate_size: int = 500,
+        surrogate_best_ratio: float = 0.5,
+        batch_size: int = 1,
+        liar: Optional[str] = None,
         **kwargs
     ):
         BaseAlgorithm.__init__(self, **kwargs)
+        if not isinstance(fit_steps, int) or fit_steps < 1:
+            raise ValueError(f'Invalid fit steps - {fit_steps!r}.')
+        if not isinstance(n_warmup, int) or n_warmup < 1:
+            raise ValueError(f'Invalid warmup count of acquisition optimizer - {n_warmup!r}.')
+        if not isinstance(n_iter, int) or n_iter < 0:
+            raise ValueError(f'Invalid iteration count of acquisition optimizer - {n_iter!r}.')
+        if surrogate not in _SURROGATES:
+            raise ValueError(f'Invalid surrogate, one of {_SURROGATES!r} expected but {surrogate!r} found.')
+        if not isinstance(surrogate_size, int) or surrogate_size < 2:
+            raise ValueError(f'Invalid surrogate size - {surrogate_size!r}.')
+        if not 0.0 <= surrogate_best_ratio <= 1.0:
+            raise ValueError(f'Invalid best ratio of surrogate - {surrogate_best_ratio!r}.')
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f'Invalid batch size - {batch_size!r}.')
+        if liar is not None and liar not in _LIARS:
+            raise ValueError(f'Invalid liar, one of {_LIARS!r} expected but {liar!r} found.')
+        if batch_size > 1 and liar is None:
+            raise ValueError('Liar should be assigned when batch size is greater than 1.')
+
         self.opt_direction = OptimizeDirection.loads(opt_direction)
         self.random_seed = seed
         self.max_steps = max_steps
         self.init_steps = init_steps
-        self.fit_steps = 1  # fit every time receiving new result
+        self.fit_steps = fit_steps  # optimize the kernel once per fit_steps results, update incrementally otherwise
+        self.async_fit = async_fit  # fit in background thread, the last fitted model is used before it is finished
         self.util_args = (acq, kappa, kappa_decay, kappa_decay_delay, xi)
+        self.acq_optimizer_args = (n_warmup, n_iter)
         self.gp_params = dict(gp_params or {})
+        self.surrogate_args = (surrogate, surrogate_size, surrogate_best_ratio)
+        self.batch_size = batch_size
+        self.liar = liar
 
     def get_session(self, space, service: ThreadService) -> 'BayesSession':
         return BayesSession(self, space, service)
@@ -83,10 +148,9 @@ class BayesSession(BaseSession):
         self._random = ensure_rng(self.__algorithm.random_seed)
         self._space_dim = len(self._pbounds)
         self._space_bounds = np.array(self._pbounds, dtype=np.float64)
-        self._space_params = np.empty(shape=(0, self._space_dim))
-        self._space_target = np.empty(shape=0)
 
-        self._opt_x_queue = Queue()
+        self._pending: Dict[int, np.ndarray] = {}  # in-flight samples, only used when liar is assigned
+        self._pending_ids = count()
         self._opt_regressor = GaussianProcessRegressor(
             kernel=Matern(nu=2.5),
             alpha=1e-6,
@@ -95,10 +159,21 @@ class BayesSession(BaseSession):
             random_state=self._random,
         )
         self._opt_regressor.set_params(**self.__algorithm.gp_params)
+        surrogate, surrogate_size, surrogate_best_ratio = self.__algorithm.surrogate_args
+        if surrogate == 'window':
+            self._surrogate = WindowedGaussianProcess(
+                self._opt_regressor, self._space_dim, surrogate_size, surrogate_best_ratio
+            )
+        else:
+            self._surrogate = IncrementalGaussianProcess(self._opt_regressor, self._space_dim)
 
         self._is_fitted = Event()
-        self._last_fit_position = 0
+        self._total_count, self._last_fit_position = 0, 0
         self._fit_sample_lock = Lock()
+        self._fit_condition = Condition(self._fit_sample_lock)
+        self._fit_requested, self._fit_closed = False, False
+        self._fit_backlog: Optional[List[Tuple[np.ndarray, float]]] = None  # observations received while fitting
+        self._fit_error: Optional[BaseException] = None
         self._step_count, self._max_step = 0, self.__algorithm.max_steps
 
         acq, kappa, kappa_decay, kappa_decay_delay, xi = self.__algorithm.util_args
@@ -116,53 +191,142 @@ class BayesSession(BaseSession):
         else:
             assert False, f'Unknown optimization direction - {self.opt_direction!r}.'  # pragma: no cover
 
-    def _create_new_sample(self) -> np.ndarray:
+    def _suggest(self, gp) -> np.ndarray:
+        n_warmup, n_iter = self.__algorithm.acq_optimizer_args
+        # noinspection PyArgumentList
+        return acq_max(
+            ac=self._util.utility,
+            gp=gp,
+            y_max=self._surrogate.y.max(),
+            bounds=self._space_bounds,
+            random_state=self._random,
+            n_warmup=n_warmup,
+            n_iter=n_iter,
+            ac_grad=self._util.utility_with_grad,
+        )
+
+    def _lies(self, xs: np.ndarray) -> np.ndarray:
+        liar = self.__algorithm.liar
+        if liar == 'believer':  # kriging believer, trust the mean of current model
+            return self._surrogate.predict(xs)
+        else:  # constant liar
+            return np.full(xs.shape[0], getattr(np, liar)(self._surrogate.y))
+
+    def _create_new_samples(self, n: int) -> List[np.ndarray]:
         with self._fit_sample_lock:
-            if self._is_fitted.is_set():  # a new suggested sample
-                # noinspection PyArgumentList
-                return acq_max(
-                    ac=self._util.utility,
-                    gp=self._opt_regressor,
-                    y_max=self._space_target.max(),
-                    bounds=self._space_bounds,
-                    random_state=self._random,
-                )
-
-            else:  # a new random sample
-                data = np.empty((1, self._space_dim))
-                for col, (lower, upper) in enumerate(self._space_bounds):
-                    data.T[col] = self._random.uniform(lower, upper, size=1)
-                return data.ravel()
+            if self._fit_error is not None:
+                raise self._fit_error
+
+            if self._is_fitted.is_set():  # new suggested samples
+                if self.__algorithm.liar is None:
+                    return [self._suggest(self._surrogate)]
 
-    def _space_append(self, x: np.ndarray, y: float):
-        self._space_params = np.concatenate([self._space_params, x.reshape(1, -1)])
-        self._space_target = np.concatenate([self._space_target, [y]])
+                # in-flight and already suggested samples are treated as observed, with the kernel kept
+                samples, gp = [], self._surrogate
+                if self._pending:
+                    xs = np.array(list(self._pending.values())).reshape(-1, self._space_dim)
+                    gp = gp.fantasize(xs, self._lies(xs))
+                for i in range(n):
+                    x_probe = self._suggest(gp)
+                    samples.append(x_probe)
+                    if i < n - 1:
+                        xs = x_probe.reshape(1, -1)
+                        gp = gp.fantasize(xs, self._lies(xs))
+                return samples
+
+            else:  # new random samples
+                data = np.empty((n, self._space_dim))
+                for col, (lower, upper) in enumerate(self._space_bounds):
+                    data.T[col] = self._random.uniform(lower, upper, size=n)
+                return list(data)
 
     def _space_fit(self):
         self._util.update_params()
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            self._opt_regressor.fit(self._space_params, self._space_target)
+        if self.__algorithm.async_fit:
+            self._fit_requested = True
+            self._fit_condition.notify_all()
+        else:
+            self._surrogate.fit()
+            self._is_fitted.set()
+
+    def _fit_loop(self):
+        while True:
+            with self._fit_condition:
+                self._fit_condition.wait_for(lambda: self._fit_requested or self._fit_closed)
+                if self._fit_closed:
+                    return
+                self._fit_requested = False
+                self._fit_backlog = []
+                surrogate = self._surrogate.copy()  # snapshot of current observations
+
+            try:
+                surrogate.fit()
+            except BaseException as err:
+                with self._fit_condition:
+                    self._fit_error = err
+                    self._fit_backlog = None
+                return
+
+            with self._fit_condition:
+                # observations received while fitting are added incrementally, then the new model is swapped in
+                for x, y in self._fit_backlog:
+                    surrogate.append(x, y)
+                self._fit_backlog = None
+                self._surrogate = surrogate
+                self._is_fitted.set()
+
+    def _return(self, task: Task, result: Result):
+        _, _, (_, pending_id) = task
+        with self._fit_sample_lock:
+            self._pending.pop(pending_id, None)
 
     def _return_on_success(self, task: Task, retval: Any):
-        _, _, (x_probe, ) = task
+        _, _, (x_probe, _) = task
         y_value = retval.value
 
         with self._fit_sample_lock:
-            self._space_append(x_probe, self._direction_postprocess(y_value))
-            _total_count, = self._space_target.shape
+            y_value = self._direction_postprocess(y_value)
+            self._surrogate.append(x_probe, y_value)
+            if self._fit_backlog is not None:
+                self._fit_backlog.append((x_probe, y_value))
+
+            self._total_count += 1
+            _total_count = self._total_count
             if (not self._is_fitted.is_set() and _total_count >= self.__algorithm.init_steps) or \
                     (self._is_fitted.is_set() and _total_count >= self._last_fit_position + self.__algorithm.fit_steps):
                 self._space_fit()
                 self._last_fit_position = _total_count
-                self._is_fitted.set()
+            elif self._is_fitted.is_set():  # cholesky factor will be extended lazily when suggesting
+                self._util.update_params()
 
     def _run(self):
-        while self._max_step is None or self._step_count < self._max_step:
-            self._step_count += 1
-            x_probe = self._create_new_sample()
-            x_actual = tuple(func(xv) for xv, func in zip(x_probe, self._pfuncs))
+        if self.__algorithm.async_fit:
+            fitter = Thread(target=self._fit_loop, daemon=True)
+            fitter.start()
             try:
-                self._put_via_space(x_actual, (x_probe, ))
-            except ServiceNoLongerAccept:
-                break
+                self._run_samples()
+            finally:
+                with self._fit_condition:
+                    self._fit_closed = True
+                    self._fit_condition.notify_all()
+        else:
+            self._run_samples()
+
+    def _run_samples(self):
+        while self._max_step is None or self._step_count < self._max_step:
+            n = self.__algorithm.batch_size
+            if self._max_step is not None:
+                n = min(n, self._max_step - self._step_count)
+
+            for x_probe in self._create_new_samples(n):
+                self._step_count += 1
+                pending_id = next(self._pending_ids)
+                if self.__algorithm.liar is not None:
+                    with self._fit_sample_lock:
+                        self._pending[pending_id] = x_probe
+
+                x_actual = tuple(func(xv) for xv, func in zip(x_probe, self._pfuncs))
+                try:
+                    self._put_via_space(x_actual, (x_probe, pending_id))
+                except ServiceNoLongerAccept:
+                    return
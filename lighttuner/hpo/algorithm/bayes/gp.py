@@ -0,0 +1,342 @@
+import copy
+import warnings
+from typing import List
+
+import numpy as np
+from scipy.linalg import cho_solve, solve_triangular, cholesky
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import RBF, Matern, ConstantKernel, WhiteKernel, Sum, Product
+
+
+def _kernel_with_grad(kernel, x: np.ndarray, y: np.ndarray):
+    """
+    Overview:
+        Get ``kernel(x, y)`` and its gradient on ``x``, shapes are ``(n, m)`` and ``(n, m, dim)``. \
+        Only stationary kernels are supported, ``None`` will be returned for the unsupported kernels.
+    """
+    if isinstance(kernel, Sum):
+        r1, r2 = _kernel_with_grad(kernel.k1, x, y), _kernel_with_grad(kernel.k2, x, y)
+        if r1 is None or r2 is None:
+            return None
+        return r1[0] + r2[0], r1[1] + r2[1]
+    elif isinstance(kernel, Product):
+        r1, r2 = _kernel_with_grad(kernel.k1, x, y), _kernel_with_grad(kernel.k2, x, y)
+        if r1 is None or r2 is None:
+            return None
+        (k1, g1), (k2, g2) = r1, r2
+        return k1 * k2, g1 * k2[..., None] + k1[..., None] * g2
+    elif isinstance(kernel, (ConstantKernel, WhiteKernel)):
+        return kernel(x, y), np.zeros((x.shape[0], y.shape[0], x.shape[1]))
+    elif isinstance(kernel, (RBF, Matern)):
+        nu = kernel.nu if isinstance(kernel, Matern) else np.inf
+        length_scale = np.asarray(kernel.length_scale, dtype=np.float64)
+        diff = (x[:, None, :] - y[None, :, :]) / length_scale  # scaled difference
+        r = np.sqrt((diff ** 2).sum(axis=-1))
+        g = diff / length_scale  # gradient of r ** 2 / 2
+
+        if nu == 0.5:
+            k = np.exp(-r)
+            coef = -k / np.where(r > 0, r, 1.0)
+        elif nu == 1.5:
+            e = np.exp(-np.sqrt(3) * r)
+            k, coef = (1.0 + np.sqrt(3) * r) * e, -3.0 * e
+        elif nu == 2.5:
+            e = np.exp(-np.sqrt(5) * r)
+            k, coef = (1.0 + np.sqrt(5) * r + 5.0 / 3.0 * r ** 2) * e, -5.0 / 3.0 * (1.0 + np.sqrt(5) * r) * e
+        elif np.isinf(nu):
+            k = np.exp(-0.5 * r ** 2)
+            coef = -k
+        else:
+            return None
+        return k, coef[..., None] * g
+    else:
+        return None
+
+
+class IncrementalGaussianProcess:
+    """
+    Overview:
+        Gaussian process surrogate which supports incremental observations.
+
+        The kernel hyper-parameters are optimized by the given ``regressor`` only when :meth:`fit` is called. \
+        Between two fits, new observations are appended to amortized-growth buffers, and the cholesky factor of \
+        the kernel matrix is extended with rank-one updates (``O(n^2)`` for each observation) the next time it \
+        is needed, instead of a ``O(n^3)`` refit.
+    """
+
+    def __init__(self, regressor: GaussianProcessRegressor, dim: int, capacity: int = 64):
+        """
+        Constructor of :class:`IncrementalGaussianProcess`.
+
+        :param regressor: Regressor used to optimize the kernel hyper-parameters, its ``alpha`` should be a scalar.
+        :param dim: Dimension of the observations.
+        :param capacity: Initial capacity of the buffers.
+        """
+        if np.ndim(regressor.alpha) != 0:
+            raise TypeError(f'Scalar alpha expected for incremental gaussian process, but {regressor.alpha!r} found.')
+
+        self._regressor = regressor
+        self._dim = dim
+        self._size = 0
+        self._x = np.empty((capacity, dim))
+        self._y = np.empty(capacity)
+
+        self._kernel = None  # fitted kernel, None means not fitted
+        self._factor = np.empty((capacity, capacity))  # lower cholesky factor of K + alpha * I
+        self._factor_inv = np.empty((capacity, capacity))  # inverse of the factor, shared by the predictions
+        self._factor_size = 0
+        self._alpha_cache = None
+
+    @property
+    def X(self) -> np.ndarray:
+        return self._x[:self._size]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y[:self._size]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def fitted(self) -> bool:
+        return self._kernel is not None
+
+    @property
+    def kernel_(self):
+        return self._kernel
+
+    def _reserve(self, n: int):
+        capacity = self._x.shape[0]
+        if n > capacity:
+            while capacity < n:
+                capacity *= 2
+
+            x, y = np.empty((capacity, self._dim)), np.empty(capacity)
+            x[:self._size] = self.X
+            y[:self._size] = self.y
+            self._x, self._y = x, y
+
+            n = self._factor_size
+            factor, factor_inv = np.empty((capacity, capacity)), np.empty((capacity, capacity))
+            factor[:n, :n] = self._factor[:n, :n]
+            factor_inv[:n, :n] = self._factor_inv[:n, :n]
+            self._factor, self._factor_inv = factor, factor_inv
+
+    def append(self, x: np.ndarray, y: float):
+        """
+        Append a new observation, the cholesky factor will be extended lazily.
+
+        :param x: Position of observation.
+        :param y: Target value of observation.
+        """
+        self._reserve(self._size + 1)
+        self._x[self._size] = np.asarray(x).ravel()
+        self._y[self._size] = y
+        self._size += 1
+        self._alpha_cache = None
+
+    def fit(self):
+        """
+        Optimize the kernel hyper-parameters with all the observations, and rebuild the cholesky factor.
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self._regressor.fit(self.X, self.y)
+        self._kernel = self._regressor.kernel_
+        self._set_factor(self._regressor.L_)
+
+    def _sync_factor(self):
+        noise = float(self._regressor.alpha)
+        for i in range(self._factor_size, self._size):  # rank-one extension for each new observation
+            x = self._x[i:i + 1]
+            k = self._kernel(self._x[:i], x)[:, 0]
+            kxx = self._kernel.diag(x)[0] + noise
+            if i > 0:
+                l_row = solve_triangular(self._factor[:i, :i], k, lower=True, check_finite=False)
+                d2 = kxx - l_row.dot(l_row)
+            else:
+                l_row, d2 = k, kxx
+
+            if d2 <= 0:  # numerical problem, just factorize the full matrix
+                self._factorize()
+                return
+
+            d = np.sqrt(d2)
+            self._factor[i, :i] = l_row
+            self._factor[:i, i] = 0.0
+            self._factor[i, i] = d
+            self._factor_inv[i, :i] = -l_row.dot(self._factor_inv[:i, :i]) / d
+            self._factor_inv[:i, i] = 0.0
+            self._factor_inv[i, i] = 1.0 / d
+            self._factor_size = i + 1
+
+    def _factorize(self):
+        K = self._kernel(self.X)
+        K[np.diag_indices_from(K)] += float(self._regressor.alpha)
+        self._set_factor(cholesky(K, lower=True, check_finite=False))
+
+    def _set_factor(self, factor: np.ndarray):
+        n = self._size
+        self._factor[:n, :n] = factor
+        self._factor_inv[:n, :n] = solve_triangular(factor, np.eye(n), lower=True, check_finite=False)
+        self._factor_size = n
+        self._alpha_cache = None
+
+    def _y_scale(self):
+        if self._regressor.normalize_y:
+            mean, std = self.y.mean(), self.y.std()
+            return mean, (std if std != 0.0 else 1.0)
+        else:
+            return 0.0, 1.0
+
+    def _state(self):
+        if not self.fitted:
+            raise RuntimeError('Gaussian process is not fitted yet.')
+
+        self._sync_factor()
+        factor = self._factor[:self._size, :self._size]
+        y_mean, y_std = self._y_scale()
+        if self._alpha_cache is None:
+            self._alpha_cache = cho_solve((factor, True), (self.y - y_mean) / y_std, check_finite=False)
+        return self._factor_inv[:self._size, :self._size], self._alpha_cache, y_mean, y_std
+
+    def predict(self, x: np.ndarray, return_std: bool = False):
+        """
+        Predict with the current model, the same as :meth:`GaussianProcessRegressor.predict`.
+
+        :param x: Positions to be predicted, shape is ``(n, dim)``.
+        :param return_std: Return the standard deviation or not.
+        :return: Mean (and standard deviation) of the predictions.
+        """
+        factor_inv, alpha, y_mean, y_std = self._state()
+        k_trans = self._kernel(x, self.X)
+        mean = k_trans.dot(alpha) * y_std + y_mean
+        if not return_std:
+            return mean
+
+        v = k_trans.dot(factor_inv.T)
+        var = self._kernel.diag(x) - np.einsum('ij,ij->i', v, v)
+        var[var < 0] = 0.0
+        return mean, np.sqrt(var) * y_std
+
+    def predict_with_grad(self, x: np.ndarray):
+        """
+        Predict with the current model, and get the gradients of mean and standard deviation.
+
+        :param x: Positions to be predicted, shape is ``(n, dim)``.
+        :return: Mean, standard deviation and their gradients, ``None`` will be returned when \
+            the kernel is not supported.
+        """
+        factor_inv, alpha, y_mean, y_std = self._state()
+        retval = _kernel_with_grad(self._kernel, x, self.X)
+        if retval is None:
+            return None
+
+        k_trans, k_grad = retval
+        mean = k_trans.dot(alpha) * y_std + y_mean
+        mean_grad = np.einsum('ijk,j->ik', k_grad, alpha) * y_std
+
+        v = k_trans.dot(factor_inv.T)
+        var = self._kernel.diag(x) - np.einsum('ij,ij->i', v, v)
+        var[var < 0] = 0.0
+        std = np.sqrt(var)
+        var_grad = -2.0 * np.einsum('ijk,ij->ik', k_grad, v.dot(factor_inv))  # diagonal is constant
+        std_grad = var_grad / (2.0 * np.where(std > 0, std, np.inf))[:, None]
+        return mean, std * y_std, mean_grad, std_grad * y_std
+
+    def fantasize(self, xs: np.ndarray, ys: np.ndarray) -> 'IncrementalGaussianProcess':
+        """
+        Create a copy of this model with extra fantasy observations, hyper-parameters are not optimized again.
+
+        :param xs: Positions of fantasy observations.
+        :param ys: Target values of fantasy observations.
+        :return: New gaussian process model.
+        """
+        if self.fitted:
+            self._sync_factor()
+        gp = self.copy()
+        for x, y in zip(xs, ys):
+            gp.append(x, y)
+        return gp
+
+    def copy(self) -> 'IncrementalGaussianProcess':
+        """
+        Create a copy of this model, the buffers are not shared.
+
+        :return: New gaussian process model.
+        """
+        gp = copy.copy(self)
+        gp._x, gp._y = self._x.copy(), self._y.copy()
+        gp._factor, gp._factor_inv = self._factor.copy(), self._factor_inv.copy()
+        return gp
+
+
+class WindowedGaussianProcess(IncrementalGaussianProcess):
+    """
+    Overview:
+        Gaussian process surrogate on a bounded window of observations.
+
+        At most ``max_size`` observations are kept in the model. When it overflows, the window is trimmed \
+        to three quarters of ``max_size``, keeping the best observations (``best_ratio`` of them) and \
+        the most recent ones, and the cholesky factor is rebuilt. So the cost of prediction and update \
+        does not grow with the total count of observations.
+    """
+
+    def __init__(
+        self,
+        regressor: GaussianProcessRegressor,
+        dim: int,
+        max_size: int = 500,
+        best_ratio: float = 0.5,
+        capacity: int = 64
+    ):
+        """
+        Constructor of :class:`WindowedGaussianProcess`.
+
+        :param regressor: Regressor used to optimize the kernel hyper-parameters, its ``alpha`` should be a scalar.
+        :param dim: Dimension of the observations.
+        :param max_size: Max size of the window.
+        :param best_ratio: Ratio of the best observations in the trimmed window.
+        :param capacity: Initial capacity of the buffers.
+        """
+        IncrementalGaussianProcess.__init__(self, regressor, dim, min(capacity, max_size + 1))
+        self._max_size = max_size
+        self._best_ratio = best_ratio
+        self._orders: List[int] = []  # sequence numbers of the observations in window
+        self._counter = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def append(self, x: np.ndarray, y: float):
+        IncrementalGaussianProcess.append(self, x, y)
+        self._orders.append(self._counter)
+        self._counter += 1
+        if self._size > self._max_size:
+            self._trim()
+
+    def _trim(self):
+        keep = max(self._max_size * 3 // 4, 1)
+        n_best = int(round(keep * self._best_ratio))
+        best = np.argsort(-self.y, kind='stable')[:n_best]
+        rest = np.setdiff1d(np.arange(self._size), best)
+        recent = rest[np.argsort(-np.array(self._orders)[rest], kind='stable')[:keep - n_best]]
+        index = np.sort(np.concatenate([best, recent]))
+
+        self._x[:keep] = self.X[index]
+        self._y[:keep] = self.y[index]
+        self._orders = [self._orders[i] for i in index]
+        self._size = keep
+        self._alpha_cache = None
+        if self.fitted:
+            self._factorize()
+        else:
+            self._factor_size = 0
+
+    def copy(self) -> 'WindowedGaussianProcess':
+        gp = IncrementalGaussianProcess.copy(self)
+        gp._orders = list(self._orders)
+        return gp
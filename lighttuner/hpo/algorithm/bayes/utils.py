@@ -5,7 +5,7 @@ from scipy.optimize import minimize
 from scipy.stats import norm
 
 
-def acq_max(ac, gp, y_max, bounds, random_state, n_warmup=10000, n_iter=10):
+def acq_max(ac, gp, y_max, bounds, random_state, n_warmup=10000, n_iter=10, ac_grad=None):
     """
     Overview:
         A function to find the maximum of the acquisition function.
@@ -14,6 +14,10 @@ def acq_max(ac, gp, y_max, bounds, random_state, n_warmup=10000, n_iter=10):
         optimization method. First by sampling `n_warmup` (1e5) points at random, \
         and then running L-BFGS-B from `n_iter` (250) random starting points.
 
+        When ``ac_grad`` is given and it supports the ``gp``, all the starting points \
+        are optimized together in one batched L-BFGS-B run with analytic gradients. \
+        Otherwise, each starting point is optimized separately with numerical gradients.
+
     :param ac: The acquisition function object that return its point-wise value.
     :param gp: A gaussian process fitted to the relevant data.
     :param y_max: The current maximum known value of the target function.
@@ -21,6 +25,8 @@ def acq_max(ac, gp, y_max, bounds, random_state, n_warmup=10000, n_iter=10):
     :param random_state: instance of np.RandomState random number generator
     :param n_warmup: number of times to randomly sample the acquisition function
     :param n_iter: number of times to run ``scipy.minimize``.
+    :param ac_grad: The function which return the point-wise value and gradient of the \
+        acquisition function, or ``None`` when ``gp`` is not supported. Default is ``None``.
     :return: x_max, The arg max of the acquisition function.
     """
 
@@ -30,32 +36,51 @@ def acq_max(ac, gp, y_max, bounds, random_state, n_warmup=10000, n_iter=10):
     x_max = x_tries[ys.argmax()]
     max_acq = ys.max()
 
-    # Explore the parameter space more thoroughly
+    # Explore the parameter space more thoroughly, the best warmup point is used as one of the seeds
     x_seeds = random_state.uniform(bounds[:, 0], bounds[:, 1], size=(n_iter, bounds.shape[0]))
-    for x_try in x_seeds:
-        # Find the minimum of minus the acquisition function
-        res = minimize(
-            lambda x: -ac(x.reshape(1, -1), gp=gp, y_max=y_max), x_try.reshape(1, -1), bounds=bounds, method="L-BFGS-B"
-        )
+    x_seeds = np.concatenate([x_max.reshape(1, -1), x_seeds])
+    if ac_grad is not None and ac_grad(x_seeds[:1], gp=gp, y_max=y_max) is not None:
+        xs, acqs = _acq_max_batched(ac_grad, gp, y_max, bounds, x_seeds)
+    else:
+        xs, acqs = _acq_max_separated(ac, gp, y_max, bounds, x_seeds)
 
-        # See if success
-        if not res.success:
-            continue
-
-        # Store it if better than previous minimum(maximum).
-        try:  # for scipy<1.8
-            fun = -res.fun[0]
-        except TypeError:  # for scipy>=1.8
-            fun = -res.fun
-        if max_acq is None or -fun >= max_acq:
-            x_max = res.x
-            max_acq = fun
+    # Store it if better than previous minimum(maximum).
+    if xs.shape[0] > 0 and acqs.max() >= max_acq:
+        x_max = xs[acqs.argmax()]
 
     # Clip output to make sure it lies within the bounds. Due to floating
     # point technicalities this is not always the case.
     return np.clip(x_max, bounds[:, 0], bounds[:, 1])
 
 
+def _acq_max_batched(ac_grad, gp, y_max, bounds, x_seeds):
+    n, dim = x_seeds.shape
+
+    def _func(z):
+        # the starting points are independent, so the sum of them can be minimized together
+        values, grads = ac_grad(z.reshape(n, dim), gp=gp, y_max=y_max)
+        return -values.sum(), -grads.ravel()
+
+    res = minimize(_func, x_seeds.ravel(), jac=True, bounds=np.tile(bounds, (n, 1)), method="L-BFGS-B")
+    xs = np.clip(res.x.reshape(n, dim), bounds[:, 0], bounds[:, 1])
+    acqs, _ = ac_grad(xs, gp=gp, y_max=y_max)
+    return xs, acqs
+
+
+def _acq_max_separated(ac, gp, y_max, bounds, x_seeds):
+    xs, acqs = [], []
+    for x_try in x_seeds:
+        # Find the minimum of minus the acquisition function
+        res = minimize(lambda x: -ac(x.reshape(1, -1), gp=gp, y_max=y_max)[0], x_try, bounds=bounds, method="L-BFGS-B")
+
+        # See if success
+        if res.success:
+            xs.append(res.x)
+            acqs.append(-float(res.fun))
+
+    return np.array(xs).reshape(-1, bounds.shape[0]), np.array(acqs)
+
+
 class UtilityFunction:
     """
     Overview:
@@ -92,6 +117,35 @@ class UtilityFunction:
         else:
             raise ValueError(f'Unknown kind - {self.kind!r}.')  # pragma: no cover
 
+    def utility_with_grad(self, x, gp, y_max):
+        """
+        Get the value and gradient of the utility function.
+
+        :param x: Positions, shape is ``(n, dim)``.
+        :param gp: Gaussian process model, which should provide ``predict_with_grad``.
+        :param y_max: The current maximum known value of the target function.
+        :return: Value and gradient of the utility, ``None`` will be returned when ``gp`` is not supported.
+        """
+        predict_with_grad = getattr(gp, 'predict_with_grad', None)
+        retval = predict_with_grad(x) if predict_with_grad is not None else None
+        if retval is None:
+            return None
+
+        mean, std, d_mean, d_std = retval
+        if self.kind == 'ucb':
+            return mean + self.kappa * std, d_mean + self.kappa * d_std
+
+        std = np.maximum(std, 1e-12)
+        a = (mean - y_max - self.xi)
+        z = a / std
+        if self.kind == 'ei':
+            cdf, pdf = norm.cdf(z), norm.pdf(z)
+            return a * cdf + std * pdf, d_mean * cdf[:, None] + d_std * pdf[:, None]
+        elif self.kind == 'poi':
+            return norm.cdf(z), (d_mean - d_std * z[:, None]) * (norm.pdf(z) / std)[:, None]
+        else:
+            raise ValueError(f'Unknown kind - {self.kind!r}.')  # pragma: no cover
+
     @staticmethod
     def _ucb(x, gp, kappa):
         with warnings.catch_warnings():
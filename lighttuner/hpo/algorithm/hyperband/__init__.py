@@ -0,0 +1,2 @@
+from .algorithm import HyperbandAlgorithm, HyperbandSession, HyperbandConfigure, BOHBAlgorithm, BOHBSession, \
+    BOHBConfigure, hyperband_brackets
@@ -0,0 +1,273 @@
+import math
+from threading import Condition
+from typing import Optional, Any, List, Dict, Tuple, Union
+
+import numpy as np
+
+from ..base import BaseAlgorithm, BaseConfigure, BaseSession, OptimizeDirection, Task
+from ..bayes import ensure_rng
+from ..tpe import ParzenSampler, vector_to_space_value
+from ...utils import ThreadService, ServiceNoLongerAccept, Result
+
+_Budget = Union[int, float]
+
+
+def hyperband_brackets(min_budget: _Budget, max_budget: _Budget, eta: int) -> List[List[Tuple[int, _Budget]]]:
+    """
+    Overview:
+        Get the brackets of hyperband, each bracket is a list of rungs, which are \
+        ``(count of configurations, budget)`` pairs.
+
+    :param min_budget: Min budget of a configuration.
+    :param max_budget: Max budget of a configuration.
+    :param eta: Reduction factor of successive halving.
+    :return: Brackets, from the most exploratory one to the one only with max budget.
+    """
+    s_max = int(math.floor(math.log(max_budget / min_budget) / math.log(eta) + 1e-9))
+    integer = isinstance(min_budget, int) and isinstance(max_budget, int)
+
+    brackets = []
+    for s in reversed(range(s_max + 1)):
+        n = int(math.ceil((s_max + 1) / (s + 1) * eta ** s))
+        rungs = []
+        for i in range(s + 1):
+            budget = max_budget * eta ** (i - s)
+            rungs.append((int(math.floor(n * eta ** -i)), int(round(budget)) if integer else float(budget)))
+        brackets.append(rungs)
+
+    return brackets
+
+
+class HyperbandConfigure(BaseConfigure):
+
+    def seed(self, s: Optional[int] = None):
+        self._settings['seed'] = s
+        return self
+
+    def budget(self, min_budget: _Budget, max_budget: _Budget):
+        self._settings['min_budget'] = min_budget
+        self._settings['max_budget'] = max_budget
+        return self
+
+    def eta(self, eta: int):
+        self._settings['eta'] = eta
+        return self
+
+
+class HyperbandAlgorithm(BaseAlgorithm):
+    # noinspection PyUnusedLocal
+    def __init__(
+        self,
+        opt_direction: OptimizeDirection,
+        seed: Optional[int] = None,
+        max_steps: Optional[int] = None,
+        min_budget: _Budget = 1,
+        max_budget: _Budget = 81,
+        eta: int = 3,
+        **kwargs
+    ):
+        BaseAlgorithm.__init__(self, **kwargs)
+        if not 0 < min_budget <= max_budget:
+            raise ValueError(f'Invalid budget range - {min_budget!r}, {max_budget!r}.')
+        if not isinstance(eta, int) or eta < 2:
+            raise ValueError(f'Invalid eta - {eta!r}.')
+
+        self.opt_direction = OptimizeDirection.loads(opt_direction)
+        self.random_seed = seed
+        self.max_steps = max_steps
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.eta = eta
+
+    def get_session(self, space, service: ThreadService) -> 'HyperbandSession':
+        return HyperbandSession(self, space, service)
+
+
+class HyperbandSession(BaseSession):
+
+    def __init__(self, algorithm: HyperbandAlgorithm, space, service: ThreadService):
+        BaseSession.__init__(self, space, service)
+        self.__algorithm: HyperbandAlgorithm = algorithm
+
+        self._spaces = tuple(hv.space for hv in self.vsp)
+        self._random = ensure_rng(self.__algorithm.random_seed)
+        self._sampler = ParzenSampler(self._spaces, random_state=self._random)
+        self._step_count, self._max_step = 0, self.__algorithm.max_steps
+
+        self._rung_condition = Condition()
+        self._rung_losses: List[float] = []
+        self._rung_pending = 0
+        self._budget_results: Dict[_Budget, List[Tuple[Any, float]]] = {}
+        self._budget_observations: Dict[_Budget, Tuple[List[np.ndarray], List[float]]] = {}
+
+    @property
+    def opt_direction(self) -> OptimizeDirection:
+        return self.__algorithm.opt_direction
+
+    @property
+    def budget_results(self) -> Dict[_Budget, List[Tuple[Any, float]]]:
+        """
+        Successful results of each budget, in the form of ``(config, value)``.
+        """
+        with self._rung_condition:
+            return {budget: list(results) for budget, results in self._budget_results.items()}
+
+    def _loss(self, v) -> float:
+        if self.opt_direction == OptimizeDirection.MAXIMIZE:
+            return -v
+        elif self.opt_direction == OptimizeDirection.MINIMIZE:
+            return v
+        else:
+            assert False, f'Unknown optimization direction - {self.opt_direction!r}.'  # pragma: no cover
+
+    def trial_args(self, task: Task) -> Dict[str, Any]:
+        _, _, (_, budget, _) = task
+        return {'budget': budget}
+
+    def _new_configs(self, n: int, budget: _Budget) -> List[np.ndarray]:
+        return [self._sampler.sample_prior() for _ in range(n)]
+
+    def _return(self, task: Task, result: Result):
+        _, config, (x, budget, index) = task
+        with self._rung_condition:
+            if result.ok:
+                value = result.retval.value
+                loss = self._loss(value)
+                self._budget_results.setdefault(budget, []).append((config, value))
+                xs, losses = self._budget_observations.setdefault(budget, ([], []))
+                xs.append(x)
+                losses.append(loss)
+            else:  # failed, skipped or pruned configurations will not be promoted
+                loss = math.inf
+
+            self._rung_losses[index] = loss
+            self._rung_pending -= 1
+            self._rung_condition.notify_all()
+
+    def _return_on_success(self, task: Task, retval: Any):
+        pass
+
+    def _return_on_failed(self, task: Task, error: Exception):
+        pass
+
+    def _run_rung(self, xs: List[np.ndarray], budget: _Budget) -> Optional[List[float]]:
+        with self._rung_condition:
+            self._rung_losses = [math.inf] * len(xs)
+            self._rung_pending = 0
+
+        for index, x in enumerate(xs):
+            if self._max_step is not None and self._step_count >= self._max_step:
+                return None
+
+            self._step_count += 1
+            _sample = tuple(
+                hv.trans(vector_to_space_value(space, xv)) for hv, space, xv in zip(self.vsp, self._spaces, x)
+            )
+            with self._rung_condition:
+                self._rung_pending += 1
+            try:
+                self._put_via_space(_sample, (x, budget, index))
+            except ServiceNoLongerAccept:
+                return None
+
+        with self._rung_condition:  # synchronous rung, all the results are necessary for promotion
+            while self._rung_pending > 0 and not self._service_dead:
+                self._rung_condition.wait(timeout=0.5)
+            return list(self._rung_losses)
+
+    def _run(self):
+        brackets = hyperband_brackets(self.__algorithm.min_budget, self.__algorithm.max_budget, self.__algorithm.eta)
+        # without max steps, only one hyperband iteration (all the brackets) will be run
+        while True:
+            for rungs in brackets:
+                n, budget = rungs[0]
+                xs = self._new_configs(n, budget)
+                for i, (_, budget) in enumerate(rungs):
+                    losses = self._run_rung(xs, budget)
+                    if losses is None:
+                        return
+                    if i + 1 < len(rungs):  # successive halving, the best ones are promoted to next rung
+                        order = np.argsort(losses, kind='stable')[:rungs[i + 1][0]]
+                        xs = [xs[j] for j in order if np.isfinite(losses[j])]
+                        if not xs:
+                            break
+
+            if self._max_step is None:
+                break
+
+
+class BOHBConfigure(HyperbandConfigure):
+
+    def set_parzen(self, gamma=..., n_candidates=..., min_points=..., random_fraction=...):
+        new_values = {
+            key: value
+            for key, value in
+            dict(gamma=gamma, n_candidates=n_candidates, min_points=min_points, random_fraction=random_fraction).items()
+            if value is not Ellipsis
+        }
+        self._settings.update(new_values)
+        return self
+
+
+class BOHBAlgorithm(HyperbandAlgorithm):
+    # noinspection PyUnusedLocal
+    def __init__(
+        self,
+        opt_direction: OptimizeDirection,
+        seed: Optional[int] = None,
+        max_steps: Optional[int] = None,
+        min_budget: _Budget = 1,
+        max_budget: _Budget = 81,
+        eta: int = 3,
+        gamma: float = 0.15,
+        n_candidates: int = 64,
+        min_points: Optional[int] = None,
+        random_fraction: float = 1 / 3,
+        **kwargs
+    ):
+        HyperbandAlgorithm.__init__(self, opt_direction, seed, max_steps, min_budget, max_budget, eta, **kwargs)
+        if not 0.0 < gamma < 1.0:
+            raise ValueError(f'Invalid gamma, value in (0, 1) expected but {gamma!r} found.')
+        if not 0.0 <= random_fraction <= 1.0:
+            raise ValueError(f'Invalid random fraction - {random_fraction!r}.')
+
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+        self.min_points = min_points
+        self.random_fraction = random_fraction
+
+    def get_session(self, space, service: ThreadService) -> 'BOHBSession':
+        return BOHBSession(self, space, service)
+
+
+class BOHBSession(HyperbandSession):
+
+    def __init__(self, algorithm: BOHBAlgorithm, space, service: ThreadService):
+        HyperbandSession.__init__(self, algorithm, space, service)
+        self.__algorithm: BOHBAlgorithm = algorithm
+        self._model_sampler = ParzenSampler(
+            self._spaces,
+            gamma=self.__algorithm.gamma,
+            n_candidates=self.__algorithm.n_candidates,
+            random_state=self._random,
+        )
+        self._min_points = self.__algorithm.min_points or len(self._spaces) + 1
+
+    def _model_observations(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        # the model is built on the largest budget with enough observations
+        with self._rung_condition:
+            for budget in sorted(self._budget_observations.keys(), reverse=True):
+                xs, losses = self._budget_observations[budget]
+                if len(losses) >= self._min_points:
+                    return np.array(xs), np.array(losses)
+        return None
+
+    def _new_configs(self, n: int, budget: _Budget) -> List[np.ndarray]:
+        observations = self._model_observations()
+        xs = []
+        for _ in range(n):
+            if observations is None or self._random.rand() < self.__algorithm.random_fraction:
+                xs.append(self._sampler.sample_prior())
+            else:
+                xs.append(self._model_sampler.suggest(*observations))
+        return xs
@@ -0,0 +1,2 @@
+from .algorithm import TPEAlgorithm, TPESession, TPEConfigure
+from .sampler import ParzenSampler, vector_to_space_value
@@ -0,0 +1,114 @@
+from threading import Lock
+from typing import Optional, Any, List
+
+import numpy as np
+
+from .sampler import ParzenSampler, vector_to_space_value
+from ..base import BaseAlgorithm, BaseConfigure, BaseSession, OptimizeDirection, Task
+from ..bayes import ensure_rng
+from ...utils import ThreadService, ServiceNoLongerAccept
+
+
+class TPEConfigure(BaseConfigure):
+
+    def seed(self, s: Optional[int] = None):
+        self._settings['seed'] = s
+        return self
+
+    def init_steps(self, steps: int):
+        self._settings['init_steps'] = steps
+        return self
+
+    def set_parzen(self, gamma=..., n_candidates=...):
+        new_values = {
+            key: value
+            for key, value in dict(gamma=gamma, n_candidates=n_candidates).items() if value is not Ellipsis
+        }
+        self._settings.update(new_values)
+        return self
+
+
+class TPEAlgorithm(BaseAlgorithm):
+    # noinspection PyUnusedLocal
+    def __init__(
+        self,
+        opt_direction: OptimizeDirection,
+        seed: Optional[int] = None,
+        max_steps: Optional[int] = None,
+        init_steps: int = 10,
+        gamma: float = 0.25,
+        n_candidates: int = 24,
+        **kwargs
+    ):
+        BaseAlgorithm.__init__(self, **kwargs)
+        if not 0.0 < gamma < 1.0:
+            raise ValueError(f'Invalid gamma, value in (0, 1) expected but {gamma!r} found.')
+        if not isinstance(n_candidates, int) or n_candidates < 1:
+            raise ValueError(f'Invalid count of candidates - {n_candidates!r}.')
+
+        self.opt_direction = OptimizeDirection.loads(opt_direction)
+        self.random_seed = seed
+        self.max_steps = max_steps
+        self.init_steps = init_steps
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+
+    def get_session(self, space, service: ThreadService) -> 'TPESession':
+        return TPESession(self, space, service)
+
+
+class TPESession(BaseSession):
+
+    def __init__(self, algorithm: TPEAlgorithm, space, service: ThreadService):
+        BaseSession.__init__(self, space, service)
+        self.__algorithm: TPEAlgorithm = algorithm
+
+        self._spaces = tuple(hv.space for hv in self.vsp)
+        self._sampler = ParzenSampler(
+            self._spaces,
+            gamma=self.__algorithm.gamma,
+            n_candidates=self.__algorithm.n_candidates,
+            random_state=ensure_rng(self.__algorithm.random_seed),
+        )
+        self._xs: List[np.ndarray] = []
+        self._losses: List[float] = []
+        self._sample_lock = Lock()
+
+    @property
+    def opt_direction(self) -> OptimizeDirection:
+        return self.__algorithm.opt_direction
+
+    def _loss(self, v) -> float:
+        if self.opt_direction == OptimizeDirection.MAXIMIZE:
+            return -v
+        elif self.opt_direction == OptimizeDirection.MINIMIZE:
+            return v
+        else:
+            assert False, f'Unknown optimization direction - {self.opt_direction!r}.'  # pragma: no cover
+
+    def _create_new_sample(self) -> np.ndarray:
+        with self._sample_lock:
+            if len(self._losses) < self.__algorithm.init_steps:
+                return self._sampler.sample_prior()
+            else:
+                return self._sampler.suggest(np.array(self._xs), np.array(self._losses))
+
+    def _return_on_success(self, task: Task, retval: Any):
+        _, _, (x, ) = task
+        with self._sample_lock:
+            self._xs.append(x)
+            self._losses.append(self._loss(retval.value))
+
+    def _run(self):
+        _step_count, _max_step = 0, self.__algorithm.max_steps
+        while _max_step is None or _step_count < _max_step:
+            _step_count += 1
+            x = self._create_new_sample()
+            _sample = tuple(
+                hv.trans(vector_to_space_value(space, xv)) for hv, space, xv in zip(self.vsp, self._spaces, x)
+            )
+
+            try:
+                self._put_via_space(_sample, (x, ))
+            except ServiceNoLongerAccept:  # service is down
+                break
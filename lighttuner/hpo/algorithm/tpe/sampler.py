@@ -0,0 +1,182 @@
+import math
+from typing import Tuple, Optional
+
+import numpy as np
+from scipy.special import logsumexp
+from scipy.stats import norm, truncnorm
+
+from ...space import BaseSpace, ContinuousSpace, SeparateSpace, FixedSpace
+
+
+class _NumericParzen:
+    """
+    Overview:
+        Truncated gaussian mixture estimator on ``[low, high]``, a prior component is included. \
+        When ``discrete`` is ``True``, the values are integers and the probability mass of \
+        ``[x - 0.5, x + 0.5]`` is used.
+    """
+
+    def __init__(self, mus: np.ndarray, low: float, high: float, discrete: bool = False):
+        self._low, self._high = low, high
+        self._discrete = discrete
+
+        prior_mu, prior_sigma = (low + high) / 2.0, high - low
+        n = mus.shape[0]
+        order = np.argsort(mus, kind='stable')
+        sorted_mus = mus[order]
+        if n > 0:  # bandwidth of each component is the farther distance to its neighbours
+            bounds = np.concatenate([[low], sorted_mus, [high]])
+            sorted_sigmas = np.maximum(bounds[1:-1] - bounds[:-2], bounds[2:] - bounds[1:-1])
+            sorted_sigmas = np.clip(sorted_sigmas, prior_sigma / min(100.0, n + 1.0), prior_sigma)
+        else:
+            sorted_sigmas = np.empty(0)
+
+        self._mus = np.append(sorted_mus, prior_mu)
+        self._sigmas = np.append(sorted_sigmas, prior_sigma)
+        self._a = (low - self._mus) / self._sigmas
+        self._b = (high - self._mus) / self._sigmas
+        self._log_z = np.log(np.maximum(norm.cdf(self._b) - norm.cdf(self._a), 1e-300))
+        self._log_w = -math.log(self._mus.shape[0])
+
+    def sample(self, size: int, random_state: np.random.RandomState) -> np.ndarray:
+        index = random_state.randint(0, self._mus.shape[0], size=size)
+        xs = truncnorm.rvs(
+            self._a[index], self._b[index], loc=self._mus[index], scale=self._sigmas[index], random_state=random_state
+        )
+        if self._discrete:
+            xs = np.clip(np.round(xs), self._low + 0.5, self._high - 0.5)
+        return xs
+
+    def log_pdf(self, xs: np.ndarray) -> np.ndarray:
+        xs = xs[:, None]
+        if self._discrete:
+            upper = norm.cdf((xs + 0.5 - self._mus) / self._sigmas)
+            lower = norm.cdf((xs - 0.5 - self._mus) / self._sigmas)
+            log_p = np.log(np.maximum(upper - lower, 1e-300))
+        else:
+            log_p = norm.logpdf(xs, loc=self._mus, scale=self._sigmas)
+        return logsumexp(log_p - self._log_z + self._log_w, axis=1)
+
+
+class _CategoricalParzen:
+    """
+    Overview:
+        Categorical estimator with one pseudo-count for each category as prior.
+    """
+
+    def __init__(self, indices: np.ndarray, count: int):
+        weights = np.bincount(indices.astype(int), minlength=count) + 1.0
+        self._p = weights / weights.sum()
+
+    def sample(self, size: int, random_state: np.random.RandomState) -> np.ndarray:
+        return random_state.choice(self._p.shape[0], size=size, p=self._p).astype(np.float64)
+
+    def log_pdf(self, xs: np.ndarray) -> np.ndarray:
+        return np.log(self._p[xs.astype(int)])
+
+
+class ParzenSampler:
+    """
+    Overview:
+        Sampler of tree-structured parzen estimator.
+
+        The observations are represented as vectors, in which continuous space is kept as its value, \
+        separate space and fixed space are represented as index. The observations are split into the \
+        better ``gamma`` part and the rest, each dimension is estimated separately with parzen estimator, \
+        and the candidate with the greatest ``l(x) / g(x)`` is suggested. The cost of each suggestion is \
+        linear in the count of observations.
+    """
+
+    def __init__(
+        self,
+        spaces: Tuple[BaseSpace, ...],
+        gamma: float = 0.25,
+        n_candidates: int = 24,
+        random_state: Optional[np.random.RandomState] = None
+    ):
+        """
+        Constructor of :class:`ParzenSampler`.
+
+        :param spaces: Spaces of the dimensions.
+        :param gamma: Ratio of the better observations.
+        :param n_candidates: Count of candidates sampled for each suggestion.
+        :param random_state: Random state, default is ``None`` which means unseeded.
+        """
+        for space in spaces:
+            if not isinstance(space, (ContinuousSpace, SeparateSpace, FixedSpace)):
+                raise TypeError(f'Unknown space type - {space!r}.')  # pragma: no cover
+
+        self._spaces = tuple(spaces)
+        self._gamma = gamma
+        self._n_candidates = n_candidates
+        self._random = random_state if random_state is not None else np.random.RandomState()
+
+    @property
+    def dim(self) -> int:
+        return len(self._spaces)
+
+    def _estimator(self, space: BaseSpace, values: np.ndarray):
+        if isinstance(space, ContinuousSpace):
+            return _NumericParzen(values, space.lbound, space.ubound)
+        elif isinstance(space, SeparateSpace):
+            return _NumericParzen(values, -0.5, space.count - 0.5, discrete=True)
+        else:
+            return _CategoricalParzen(values, space.count)
+
+    def sample_prior(self) -> np.ndarray:
+        """
+        Sample uniformly from the spaces.
+
+        :return: Sampled vector.
+        """
+        x = np.empty(self.dim)
+        for i, space in enumerate(self._spaces):
+            if isinstance(space, ContinuousSpace):
+                x[i] = self._random.uniform(space.lbound, space.ubound)
+            else:
+                x[i] = self._random.randint(0, space.count)
+        return x
+
+    def suggest(self, xs: np.ndarray, losses: np.ndarray) -> np.ndarray:
+        """
+        Suggest a new vector from the observations.
+
+        :param xs: Observed vectors, shape is ``(n, dim)``.
+        :param losses: Losses of the observations, the smaller the better.
+        :return: Suggested vector.
+        """
+        n = losses.shape[0]
+        if n == 0:
+            return self.sample_prior()
+
+        n_below = max(1, int(math.ceil(self._gamma * n)))
+        order = np.argsort(losses, kind='stable')
+        below, above = xs[order[:n_below]], xs[order[n_below:]]
+
+        candidates = np.empty((self._n_candidates, self.dim))
+        scores = np.zeros(self._n_candidates)
+        for i, space in enumerate(self._spaces):
+            l_est, g_est = self._estimator(space, below[:, i]), self._estimator(space, above[:, i])
+            candidates[:, i] = l_est.sample(self._n_candidates, self._random)
+            scores += l_est.log_pdf(candidates[:, i]) - g_est.log_pdf(candidates[:, i])
+
+        return candidates[np.argmax(scores)]
+
+
+def vector_to_space_value(space: BaseSpace, v: float):
+    """
+    Overview:
+        Turn the value in vector into the value of space.
+
+    :param space: Space of this dimension.
+    :param v: Value in vector.
+    :return: Value of space, which can be transformed by :meth:`HyperValue.trans`.
+    """
+    if isinstance(space, ContinuousSpace):
+        return float(v)
+    elif isinstance(space, SeparateSpace):
+        return int(round(v)) * space.step + space.start
+    elif isinstance(space, FixedSpace):
+        return int(round(v))
+    else:
+        raise TypeError(f'Unknown space type - {space!r}.')  # pragma: no cover
@@ -1,3 +1,4 @@
 from .hpo import hpo
 from .model import C, R, M
-from .signal import Skip
+from .pruning import BasePruner, ASHAPruner, Reporter
+from .signal import Skip, Prune
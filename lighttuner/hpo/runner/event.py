@@ -2,7 +2,7 @@ from typing import Type, Dict, Any, Callable, Tuple, Iterable
 
 from hbutils.model import AutoIntEnum
 
-from .model import RunResult, RunFailed, RunSkipped
+from .model import RunResult, RunFailed, RunSkipped, RunPruned
 from .result import _ResultExpression
 from ..algorithm import Task, BaseAlgorithm
 # noinspection PyArgumentList
@@ -24,6 +24,7 @@ class RunnerStatus(AutoIntEnum):
     STEP_OK = 'step_ok'  # step_ok(retval, metrics)
     STEP_FAIL = 'step_fail'  # step_fail(error, metrics)
     STEP_SKIP = 'step_skip'  # step_skip(error, args)
+    STEP_PRUNE = 'step_prune'  # step_prune(error)
     STEP_FINAL = 'step_final'  # step_final(ranklist)
 
     TRY = 'try_'  # try(try_id, max_try)
@@ -31,6 +32,7 @@ class RunnerStatus(AutoIntEnum):
     TRY_OK = 'try_ok'  # try_ok(retval)
     TRY_FAIL = 'try_fail'  # try_fail(error)
     TRY_SKIP = 'try_skip'  # try_skip(args)
+    TRY_PRUNE = 'try_prune'  # try_prune(step, value)
 
 
 class RunnerEventSet:
@@ -64,6 +66,9 @@ class RunnerEventSet:
     def step_skip(self, task: Task, error: RunSkipped):
         pass  # pragma: no cover
 
+    def step_prune(self, task: Task, error: RunPruned):
+        pass  # pragma: no cover
+
     def step_final(self, task: Task, ranklist: RankList):
         pass  # pragma: no cover
 
@@ -82,3 +87,6 @@ class RunnerEventSet:
 
     def try_skip(self, task: Task, try_id: int, max_try: int, args: Tuple[Any, ...], metrics: Dict[str, Any]):
         pass  # pragma: no cover
+
+    def try_prune(self, task: Task, try_id: int, max_try: int, step: int, value: float, metrics: Dict[str, Any]):
+        pass  # pragma: no cover
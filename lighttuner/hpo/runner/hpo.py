@@ -2,7 +2,8 @@ from typing import Type
 
 from .runner import ParallelSearchRunner
 from ..algorithm import RandomAlgorithm, RandomConfigure, GridConfigure, GridAlgorithm, BaseAlgorithm, \
-    BayesConfigure, BayesAlgorithm
+    BayesConfigure, BayesAlgorithm, TPEConfigure, TPEAlgorithm, HyperbandConfigure, HyperbandAlgorithm, BOHBConfigure, \
+    BOHBAlgorithm
 
 
 class _RandomRunner(ParallelSearchRunner, RandomConfigure):
@@ -26,6 +27,27 @@ class _BayesRunner(ParallelSearchRunner, BayesConfigure):
         ParallelSearchRunner.__init__(self, BayesAlgorithm, func, silent)
 
 
+class _TPERunner(ParallelSearchRunner, TPEConfigure):
+
+    def __init__(self, func, silent: bool = False):
+        TPEConfigure.__init__(self, {})
+        ParallelSearchRunner.__init__(self, TPEAlgorithm, func, silent)
+
+
+class _HyperbandRunner(ParallelSearchRunner, HyperbandConfigure):
+
+    def __init__(self, func, silent: bool = False):
+        HyperbandConfigure.__init__(self, {})
+        ParallelSearchRunner.__init__(self, HyperbandAlgorithm, func, silent)
+
+
+class _BOHBRunner(ParallelSearchRunner, BOHBConfigure):
+
+    def __init__(self, func, silent: bool = False):
+        BOHBConfigure.__init__(self, {})
+        ParallelSearchRunner.__init__(self, BOHBAlgorithm, func, silent)
+
+
 class HpoFunc:
 
     def __init__(self, func):
@@ -46,6 +68,15 @@ class HpoFunc:
     def bayes(self, silent: bool = False) -> _BayesRunner:
         return _BayesRunner(self.__func, silent)
 
+    def tpe(self, silent: bool = False) -> _TPERunner:
+        return _TPERunner(self.__func, silent)
+
+    def hyperband(self, silent: bool = False) -> _HyperbandRunner:
+        return _HyperbandRunner(self.__func, silent)
+
+    def bohb(self, silent: bool = False) -> _BOHBRunner:
+        return _BOHBRunner(self.__func, silent)
+
     def __repr__(self):
         return f'<{type(self).__name__} of {self.__func!r}>'
 
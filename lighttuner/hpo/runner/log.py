@@ -9,7 +9,7 @@ from hbutils.scale import time_to_delta_str
 from hbutils.string import plural_word
 
 from .event import RunnerEventSet
-from .model import RunResult, RunSkipped, RunFailed
+from .model import RunResult, RunSkipped, RunFailed, RunPruned
 from .result import R as _OR, _to_callable
 from .result import _ResultExpression
 from ..algorithm import BaseAlgorithm, Task
@@ -118,6 +118,17 @@ class LoggingEventSet(RunnerEventSet):
             ).strip()
         )
 
+    def step_prune(self, task: Task, error: RunPruned):
+        r_time_cost = error.metrics['time']
+        self._logger.info(
+            dedent(
+                f"""
+            Sample [yellow]pruned[/], time cost: {"%.3f" % r_time_cost} seconds,
+            at step {error.step!r} with intermediate value [bold bright_white underline]{error.value!r}[/].
+        """
+            ).strip()
+        )
+
     def step_final(self, task: Task, ranklist: RankList):
         self._logger.info(
             dedent(f"""
@@ -156,6 +167,9 @@ Current ranklist ({plural_word(len(ranklist), 'best record')}):
     def try_skip(self, task: Task, try_id: int, max_try: int, args: Tuple[Any, ...], metrics: Dict[str, Any]):
         pass
 
+    def try_prune(self, task: Task, try_id: int, max_try: int, step: int, value: float, metrics: Dict[str, Any]):
+        pass
+
 
 def escape(s: str) -> str:
     return s.replace('[', '\\[')
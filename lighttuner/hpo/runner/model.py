@@ -2,7 +2,7 @@ from typing import Any, Mapping
 
 from .result import R as _OR
 from .result import _to_callable
-from .signal import Skip
+from .signal import Skip, Prune
 from ..algorithm import Task
 
 C = _OR['config']
@@ -77,3 +77,19 @@ class RunSkipped(Exception, _IResultMetrics):
         _IResultMetrics.__init__(self, task, metrics)
         Exception.__init__(self, *err.args)
         self.with_traceback(err.__traceback__)
+
+
+class RunPruned(Exception, _IResultMetrics):
+
+    def __init__(self, task: Task, err: Prune, metrics: Mapping):
+        _IResultMetrics.__init__(self, task, metrics)
+        Exception.__init__(self, *err.args)
+        self.with_traceback(err.__traceback__)
+
+    @property
+    def step(self) -> int:
+        return self.args[0]
+
+    @property
+    def value(self) -> float:
+        return self.args[1]
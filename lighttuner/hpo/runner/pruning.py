@@ -0,0 +1,127 @@
+import math
+from threading import Lock
+from typing import Dict, List, Optional
+
+from .signal import Prune
+from ..algorithm import OptimizeDirection
+
+
+class BasePruner:
+    """
+    Overview:
+        Base class of pruners, which decide whether a trial should be stopped early \
+        according to its intermediate values.
+
+        .. warning::
+            This is an abstract class, do not use.
+    """
+
+    def should_prune(self, task_id: int, step: int, value: float) -> bool:
+        """
+        Check if the trial should be pruned, this method is called for each intermediate report.
+
+        :param task_id: Id of task.
+        :param step: Step (resource) of this report.
+        :param value: Intermediate value of this report.
+        :return: Should be pruned or not.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+
+class ASHAPruner(BasePruner):
+    """
+    Overview:
+        Pruner of asynchronous successive halving algorithm.
+
+        The rungs are placed at the steps of ``min_resource * reduction_factor ** (k + min_early_stopping_rate)``. \
+        When a trial reaches a rung, its value is recorded in this rung, and it can only continue when \
+        it is in the best ``1 / reduction_factor`` of the values recorded in this rung.
+    """
+
+    def __init__(
+        self,
+        opt_direction: OptimizeDirection,
+        min_resource: int = 1,
+        reduction_factor: int = 3,
+        min_early_stopping_rate: int = 0
+    ):
+        """
+        Constructor of :class:`ASHAPruner`.
+
+        :param opt_direction: Optimization direction of the intermediate values.
+        :param min_resource: Resource of the first rung.
+        :param reduction_factor: Reduction factor of the rungs.
+        :param min_early_stopping_rate: Rate of the first rung, default is ``0``.
+        """
+        if not isinstance(min_resource, int) or min_resource < 1:
+            raise ValueError(f'Invalid min resource - {min_resource!r}.')
+        if not isinstance(reduction_factor, int) or reduction_factor < 2:
+            raise ValueError(f'Invalid reduction factor - {reduction_factor!r}.')
+        if not isinstance(min_early_stopping_rate, int) or min_early_stopping_rate < 0:
+            raise ValueError(f'Invalid min early stopping rate - {min_early_stopping_rate!r}.')
+
+        self.__opt_direction = OptimizeDirection.loads(opt_direction)
+        self.__min_resource = min_resource
+        self.__reduction_factor = reduction_factor
+        self.__min_early_stopping_rate = min_early_stopping_rate
+
+        self.__lock = Lock()
+        self.__rungs: List[List[float]] = []  # recorded values of each rung
+        self.__trial_rungs: Dict[int, int] = {}  # count of rungs reached by each trial
+
+    def rung_resource(self, rung: int) -> int:
+        return self.__min_resource * self.__reduction_factor ** (rung + self.__min_early_stopping_rate)
+
+    def _is_promotable(self, value: float, values: List[float]) -> bool:
+        reverse = self.__opt_direction == OptimizeDirection.MAXIMIZE
+        ordered = sorted(values, reverse=reverse)
+        threshold = ordered[max(len(ordered) // self.__reduction_factor - 1, 0)]
+        return value >= threshold if reverse else value <= threshold
+
+    def should_prune(self, task_id: int, step: int, value: float) -> bool:
+        with self.__lock:
+            rung = self.__trial_rungs.get(task_id, 0)
+            while step >= self.rung_resource(rung):  # all the rungs reached by this report
+                if len(self.__rungs) <= rung:
+                    self.__rungs.append([])
+                self.__rungs[rung].append(value)
+                rung += 1
+                self.__trial_rungs[task_id] = rung
+                if not self._is_promotable(value, self.__rungs[rung - 1]):
+                    return True
+
+            return False
+
+
+class Reporter:
+    """
+    Overview:
+        Reporter of intermediate values, which is passed to the black-box function \
+        as the ``reporter`` argument when pruning is enabled.
+
+        When the trial should be pruned, :class:`lighttuner.hpo.runner.signal.Prune` will be raised.
+    """
+
+    def __init__(self, task_id: int, pruner: BasePruner):
+        self.__task_id = task_id
+        self.__pruner = pruner
+        self.__last_step = 0
+
+    @property
+    def last_step(self) -> int:
+        return self.__last_step
+
+    def report(self, value: float, step: Optional[int] = None):
+        """
+        Report an intermediate value.
+
+        :param value: Intermediate value, which has the same optimization direction with the target.
+        :param step: Step (resource) of this value, default is ``None`` which means the last step plus 1.
+        """
+        step = self.__last_step + 1 if step is None else step
+        self.__last_step = step
+        if not math.isnan(value) and self.__pruner.should_prune(self.__task_id, step, value):
+            raise Prune(step, value)
+
+    def __call__(self, value: float, step: Optional[int] = None):
+        self.report(value, step)
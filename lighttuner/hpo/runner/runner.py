@@ -1,5 +1,7 @@
+import inspect
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
 from threading import Lock
 from typing import Tuple, Any, Type, Dict, Callable, Optional, Iterator
@@ -9,9 +11,10 @@ from hbutils.reflection import sigsupply, dynamic_call
 
 from .event import RunnerStatus, RunnerEventSet
 from .log import LoggingEventSet
-from .model import RunSkipped, RunResult, RunFailed, C
+from .model import RunSkipped, RunResult, RunFailed, RunPruned, C
+from .pruning import ASHAPruner, Reporter
 from .result import _to_expr, _ResultExpression
-from .signal import Skip
+from .signal import Skip, Prune
 from ..algorithm import BaseAlgorithm, OptimizeDirection, Task, BaseSession
 from ..utils import ThreadService, Result, EventModel, RankList
 from ..value import HyperValue
@@ -25,6 +28,39 @@ def _space_exprs(space) -> Iterator[Tuple[str, _ResultExpression]]:
             yield name, expr
 
 
+_BACKENDS = ('thread', 'process')
+_process_target_func: Optional[Callable] = None
+
+
+def _make_target_func(func) -> Callable:
+    func = sigsupply(func, lambda v: None)
+    _positional_names = [
+        param.name for param in inspect.signature(func).parameters.values()
+        if param.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    _call = dynamic_call(func)
+
+    def _target_func(config, task_id, **extras):
+        # extra arguments (such as reporter) are passed by name, so positional ones before them are kept only
+        args = (config, task_id)
+        for i, name in enumerate(_positional_names[:len(args)]):
+            if name in extras:
+                args = args[:i]
+                break
+        return _call(*args, **extras)
+
+    return _target_func
+
+
+def _process_worker_init(func):
+    global _process_target_func
+    _process_target_func = _make_target_func(func)
+
+
+def _process_worker_call(config, task_id, **extras):
+    return _process_target_func(config, task_id, **extras)
+
+
 def _expr_to_frank(expr):
     _expr = _to_expr(expr)
 
@@ -47,13 +83,16 @@ class ParallelSearchRunner:
             'max_steps': None,
             'opt_direction': None,
             'max_workers': os.cpu_count(),
+            'backend': 'thread',
         })
         self.__algorithm_cls = algo_cls  # old_algorithm class
 
         # about control
         self.__max_workers = os.cpu_count()
+        self.__backend = 'thread'
         self.__max_try = 3
         self.__stop_condition = None
+        self.__pruner_args: Optional[Dict[str, Any]] = None
 
         # about target
         self.__target_key = None
@@ -103,6 +142,27 @@ class ParallelSearchRunner:
         else:
             raise ValueError(f'Invalid max workers count - {n!r}.')
 
+    def backend(self, name: str) -> 'ParallelSearchRunner':
+        if name in _BACKENDS:
+            self.__backend = name
+            self._settings['backend'] = name
+            return self
+        else:
+            raise ValueError(f'Invalid backend, one of {_BACKENDS!r} expected but {name!r} found.')
+
+    def asha(
+            self,
+            min_resource: int = 1,
+            reduction_factor: int = 3,
+            min_early_stopping_rate: int = 0
+    ) -> 'ParallelSearchRunner':
+        self.__pruner_args = dict(
+            min_resource=min_resource,
+            reduction_factor=reduction_factor,
+            min_early_stopping_rate=min_early_stopping_rate,
+        )
+        return self
+
     def max_retries(self, n: int) -> 'ParallelSearchRunner':
         if isinstance(n, int) and n >= 1:
             self.__max_try = n  # TODO: change n to n+1, this is max_retries
@@ -167,6 +227,8 @@ class ParallelSearchRunner:
                 'Optimize target is not given, '
                 'please use maximize or minimize method to assign a target for optimization.'
             )
+        if self.__pruner_args is not None and self.__backend == 'process':
+            raise ValueError('Pruning is not supported in process backend.')
 
     def run(self) -> Optional[Tuple[Any, Any, Any]]:
         self._check_config()
@@ -177,7 +239,23 @@ class ParallelSearchRunner:
         _max_workers = self.__max_workers
         _max_try = self.__max_try
 
-        _target_func = dynamic_call(sigsupply(self.__func, lambda v: None))
+        _process_pool: Optional[ProcessPoolExecutor] = None
+        if self.__backend == 'process':
+            # the objective is installed once per worker process, only config and task id are sent for each try
+            _process_pool = ProcessPoolExecutor(
+                max_workers=_max_workers, initializer=_process_worker_init, initargs=(self.__func, )
+            )
+            _process_pool.submit(os.getpid).result()  # start the workers before any service thread is running
+
+            def _target_func(config, task_id, **extras):
+                return _process_pool.submit(_process_worker_call, config, task_id, **extras).result()
+
+        else:
+            _target_func = _make_target_func(self.__func)
+        if self.__pruner_args is not None:
+            _pruner = ASHAPruner(self._opt_direction, **self.__pruner_args)
+        else:
+            _pruner = None
         _target_key = self.__target_key
         _params = list(_space_exprs(self.__spaces))
 
@@ -215,11 +293,17 @@ class ParallelSearchRunner:
                 r_err, r_metrics = None, None
                 for i in range(_max_try):
                     _events.trigger(RunnerStatus.TRY, task, i, _max_try)
+                    _extras = dict(session.trial_args(task))
+                    if _pruner is not None:
+                        _extras['reporter'] = Reporter(_task_id, _pruner)
                     _before_time = time.time()
+                    cur_prune = False
                     try:
-                        cur_retval, cur_err, cur_skip = _target_func(_config, _task_id), None, False
+                        cur_retval, cur_err, cur_skip = _target_func(_config, _task_id, **_extras), None, False
                     except Skip as err:
                         cur_retval, cur_err, cur_skip = None, err, True
+                    except Prune as err:
+                        cur_retval, cur_err, cur_skip, cur_prune = None, err, False, True
                     except BaseException as err:
                         cur_retval, cur_err, cur_skip = None, err, False
                     finally:
@@ -232,6 +316,9 @@ class ParallelSearchRunner:
                     if cur_skip:
                         _events.trigger(RunnerStatus.TRY_SKIP, task, i, _max_try, cur_err.args, cur_metrics)
                         raise RunSkipped(task, cur_err, cur_metrics)
+                    elif cur_prune:
+                        _events.trigger(RunnerStatus.TRY_PRUNE, task, i, _max_try, *cur_err.args, cur_metrics)
+                        raise RunPruned(task, cur_err, cur_metrics)
                     elif cur_err is None:
                         _events.trigger(RunnerStatus.TRY_OK, task, i, _max_try, cur_retval, cur_metrics)
                         return RunResult(task, cur_retval, cur_metrics, _target_key)
@@ -242,7 +329,7 @@ class ParallelSearchRunner:
                 raise RunFailed(task, r_err, r_metrics)
 
             def _after_exec(self, task: Task, result: Result):
-                if not result and not isinstance(result.error, (RunFailed, RunSkipped)):
+                if not result and not isinstance(result.error, (RunFailed, RunSkipped, RunPruned)):
                     # unexpected error is met, should notify the user
                     raise result.error  # pragma: no cover
 
@@ -259,6 +346,8 @@ class ParallelSearchRunner:
                         _events.trigger(RunnerStatus.STEP_FAIL, task, result.error)
                     elif isinstance(error, RunSkipped):
                         _events.trigger(RunnerStatus.STEP_SKIP, task, result.error)
+                    elif isinstance(error, RunPruned):  # pruned samples are not ranked
+                        _events.trigger(RunnerStatus.STEP_PRUNE, task, result.error)
                     else:  # strange error, it should be already raised on _after_exec
                         raise RuntimeError(
                             'Unexpected error occurred, please notify the developers.'
@@ -284,6 +373,8 @@ class ParallelSearchRunner:
         finally:
             session.join()
             service.shutdown(True)
+            if _process_pool is not None:
+                _process_pool.shutdown(True)
 
         if session.error or service.error:
             raise session.error or service.error
@@ -7,3 +7,15 @@ class Skip(BaseException):
         it means the current sample will be skipped.
     """
     pass
+
+
+class Prune(BaseException):
+    """
+    Overview:
+        Prune signal exception.
+
+        It is raised by the reporter of intermediate values, which means the current sample \
+        is not promising and will be stopped early. The arguments are the step and intermediate \
+        value at which the sample is pruned.
+    """
+    pass
@@ -134,3 +134,119 @@ class TestHpoAlgorithmBayesAlgorithm:
 
         assert res['result'] >= 2900
         assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    @pytest.mark.flaky(reruns=3)
+    def test_bayes_single_maximize_with_fit_steps(self):
+        cfg, res, metrics = opt_func.bayes(silent=True) \
+            .max_steps(50) \
+            .init_steps(10) \
+            .fit_steps(3) \
+            .maximize(R['result']) \
+            .concern(M['time'], 'time_cost') \
+            .concern(R['sum'], 'sum') \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['result'] >= 2900
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    @pytest.mark.flaky(reruns=3)
+    @pytest.mark.parametrize('liar', [None, 'min'])
+    def test_bayes_single_maximize_with_async_fit(self, liar):
+        cfg, res, metrics = opt_func.bayes(silent=True) \
+            .max_steps(50) \
+            .init_steps(10) \
+            .async_fit() \
+            .batch(2 if liar else 1, liar) \
+            .max_workers(4) \
+            .maximize(R['result']) \
+            .concern(M['time'], 'time_cost') \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['result'] >= 2900
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    @pytest.mark.flaky(reruns=3)
+    def test_bayes_single_maximize_with_window(self):
+        cfg, res, metrics = opt_func.bayes(silent=True) \
+            .max_steps(50) \
+            .init_steps(10) \
+            .surrogate('window', max_size=20) \
+            .maximize(R['result']) \
+            .concern(M['time'], 'time_cost') \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['result'] >= 2900
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    @pytest.mark.flaky(reruns=3)
+    @pytest.mark.parametrize('acq', ['ucb', 'ei'])
+    def test_bayes_single_maximize_with_acq_optimizer(self, acq):
+        cfg, res, metrics = opt_func.bayes(silent=True) \
+            .max_steps(50) \
+            .acq(acq) \
+            .init_steps(10) \
+            .set_acq_optimizer(n_warmup=2000, n_iter=20) \
+            .maximize(R['result']) \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['result'] >= 2900
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    @pytest.mark.flaky(reruns=3)
+    @pytest.mark.parametrize('liar', ['min', 'mean', 'max', 'believer'])
+    def test_bayes_batch_maximize(self, liar):
+        cfg, res, metrics = opt_func.bayes(silent=True) \
+            .max_steps(50) \
+            .init_steps(10) \
+            .batch(4, liar) \
+            .max_workers(4) \
+            .maximize(R['result']) \
+            .concern(M['time'], 'time_cost') \
+            .concern(R['sum'], 'sum') \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['result'] >= 2900
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    def test_bayes_batch_invalid(self):
+        with pytest.raises(ValueError):
+            opt_func.bayes(silent=True).max_steps(10).batch(4, 'liar').maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125)}).run()
+        with pytest.raises(ValueError):
+            opt_func.bayes(silent=True).max_steps(10).batch(4, None).maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125)}).run()
+        with pytest.raises(ValueError):
+            opt_func.bayes(silent=True).max_steps(10).batch(0).maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125)}).run()
+        with pytest.raises(ValueError):
+            opt_func.bayes(silent=True).max_steps(10).fit_steps(0).maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125)}).run()
+        with pytest.raises(ValueError):
+            opt_func.bayes(silent=True).max_steps(10).set_acq_optimizer(n_warmup=0).maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125)}).run()
+        with pytest.raises(ValueError):
+            opt_func.bayes(silent=True).max_steps(10).surrogate('sparse').maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125)}).run()
+        with pytest.raises(ValueError):
+            opt_func.bayes(silent=True).max_steps(10).surrogate('window', best_ratio=2.0).maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125)}).run()
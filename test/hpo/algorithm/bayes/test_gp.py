@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import Matern
+
+from lighttuner.hpo.algorithm.bayes import IncrementalGaussianProcess, WindowedGaussianProcess
+
+
+def _get_y(x):
+    return -(x[:, 0] - 0.3) ** 2 - 0.5 * (x[:, 1] - 0.6) ** 2 + 2
+
+
+@pytest.mark.unittest
+class TestHpoAlgorithmBayesGp:
+
+    def test_incremental(self):
+        rnd = np.random.RandomState(0)
+        x, xt = rnd.uniform(0, 1, size=(40, 2)), rnd.uniform(0, 1, size=(20, 2))
+        y = _get_y(x)
+
+        gp = IncrementalGaussianProcess(
+            GaussianProcessRegressor(kernel=Matern(nu=2.5), alpha=1e-6, normalize_y=True, random_state=rnd),
+            dim=2,
+            capacity=4,
+        )
+        assert not gp.fitted
+        with pytest.raises(RuntimeError):
+            gp.predict(xt)
+
+        for xv, yv in zip(x[:10], y[:10]):
+            gp.append(xv, yv)
+        gp.fit()
+        assert gp.fitted
+        for xv, yv in zip(x[10:], y[10:]):
+            gp.append(xv, yv)
+        assert gp.size == 40
+        assert gp.X == pytest.approx(x)
+        assert gp.y == pytest.approx(y)
+
+        # same kernel, full fit without optimization
+        expected = GaussianProcessRegressor(kernel=gp.kernel_, alpha=1e-6, normalize_y=True, optimizer=None)
+        expected.fit(x, y)
+        mean, std = gp.predict(xt, return_std=True)
+        e_mean, e_std = expected.predict(xt, return_std=True)
+        assert mean == pytest.approx(e_mean, abs=1e-6)
+        assert std == pytest.approx(e_std, abs=1e-6)
+        assert gp.predict(xt) == pytest.approx(e_mean, abs=1e-6)
+
+    def test_fantasize(self):
+        rnd = np.random.RandomState(0)
+        x = rnd.uniform(0, 1, size=(15, 2))
+        y = _get_y(x)
+
+        gp = IncrementalGaussianProcess(GaussianProcessRegressor(kernel=Matern(nu=2.5), alpha=1e-6), dim=2)
+        for xv, yv in zip(x[:10], y[:10]):
+            gp.append(xv, yv)
+        gp.fit()
+
+        fgp = gp.fantasize(x[10:], y[10:])
+        assert gp.size == 10
+        assert fgp.size == 15
+        assert fgp.kernel_ is gp.kernel_
+        assert fgp.predict(x[10:]) == pytest.approx(y[10:], abs=1e-3)
+
+    def test_invalid_alpha(self):
+        with pytest.raises(TypeError):
+            IncrementalGaussianProcess(GaussianProcessRegressor(alpha=np.ones(5)), dim=2)
+
+    def test_copy(self):
+        rnd = np.random.RandomState(0)
+        x = rnd.uniform(0, 1, size=(15, 2))
+        y = _get_y(x)
+
+        gp = IncrementalGaussianProcess(GaussianProcessRegressor(kernel=Matern(nu=2.5), alpha=1e-6), dim=2)
+        for xv, yv in zip(x[:10], y[:10]):
+            gp.append(xv, yv)
+
+        cgp = gp.copy()
+        cgp.fit()
+        for xv, yv in zip(x[10:], y[10:]):
+            cgp.append(xv, yv)
+        assert not gp.fitted
+        assert gp.size == 10
+        assert cgp.fitted
+        assert cgp.size == 15
+        assert cgp.X[:10] == pytest.approx(gp.X)
+
+    def test_windowed(self):
+        rnd = np.random.RandomState(0)
+        x, xt = rnd.uniform(0, 1, size=(100, 2)), rnd.uniform(0, 1, size=(20, 2))
+        y = _get_y(x)
+
+        gp = WindowedGaussianProcess(
+            GaussianProcessRegressor(kernel=Matern(nu=2.5), alpha=1e-6, normalize_y=True),
+            dim=2, max_size=40, best_ratio=0.5,
+        )
+        assert gp.max_size == 40
+        for xv, yv in zip(x[:20], y[:20]):
+            gp.append(xv, yv)
+        gp.fit()
+        for xv, yv in zip(x[20:], y[20:]):
+            gp.append(xv, yv)
+            assert gp.size <= 40
+
+        assert gp.y.max() == pytest.approx(y.max())
+        assert set(map(tuple, x[-10:])) <= set(map(tuple, gp.X))
+        expected = GaussianProcessRegressor(kernel=gp.kernel_, alpha=1e-6, normalize_y=True, optimizer=None)
+        expected.fit(gp.X, gp.y)
+        mean, std = gp.predict(xt, return_std=True)
+        e_mean, e_std = expected.predict(xt, return_std=True)
+        assert mean == pytest.approx(e_mean, abs=1e-6)
+        assert std == pytest.approx(e_std, abs=1e-6)
+
+        size = gp.size
+        cgp = gp.copy()
+        cgp.append(xt[0], 1.0)
+        assert gp.size == size
+        assert cgp.size == (size + 1 if size < 40 else 30)
@@ -3,7 +3,7 @@ import pytest
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import Matern
 
-from lighttuner.hpo.algorithm.bayes import UtilityFunction, acq_max, ensure_rng
+from lighttuner.hpo.algorithm.bayes import UtilityFunction, acq_max, ensure_rng, IncrementalGaussianProcess
 
 
 def get_globals():
@@ -114,3 +114,52 @@ def test_acq_with_poi():
     _, brute_max_arg = brute_force_maximum(MESH, GP, kind='poi', kappa=1.0, xi=1e-4)
 
     assert all(abs(brute_max_arg - max_arg) < episilon)
+
+
+def _get_incremental_gp():
+    gp = IncrementalGaussianProcess(GaussianProcessRegressor(kernel=Matern(), n_restarts_optimizer=25), dim=2)
+    for x, y in zip(X, Y):
+        gp.append(x, y)
+    gp.fit()
+    return gp
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(['kind', 'xi'], [('ucb', 1.0), ('ei', 1e-6), ('poi', 1e-4)])
+def test_acq_with_grad(kind, xi):
+    gp = _get_incremental_gp()
+    util = UtilityFunction(kind=kind, kappa=1.0, xi=xi)
+    episilon = 1e-2
+    y_max = 2.0
+
+    max_arg = acq_max(
+        util.utility,
+        gp,
+        y_max,
+        bounds=np.array([[0, 1], [0, 1]]),
+        random_state=ensure_rng(0),
+        n_iter=20,
+        ac_grad=util.utility_with_grad,
+    )
+    _, brute_max_arg = brute_force_maximum(MESH, gp, kind=kind, kappa=1.0, xi=xi)
+
+    assert all(abs(brute_max_arg - max_arg) < episilon)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize('kind', ['ucb', 'ei', 'poi'])
+def test_utility_with_grad(kind):
+    gp = _get_incremental_gp()
+    util = UtilityFunction(kind=kind, kappa=1.0, xi=1e-2)
+    assert util.utility_with_grad(MESH[:5], GP, 2.0) is None
+
+    x = ensure_rng(0).uniform(0, 1, size=(10, 2))
+    values, grads = util.utility_with_grad(x, gp, 2.0)
+    assert values == pytest.approx(util.utility(x, gp, 2.0))
+
+    eps = 1e-6
+    for i in range(2):
+        delta = np.zeros(2)
+        delta[i] = eps
+        expected = (util.utility(x + delta, gp, 2.0) - util.utility(x - delta, gp, 2.0)) / (2 * eps)
+        assert grads[:, i] == pytest.approx(expected, rel=1e-3, abs=1e-6)
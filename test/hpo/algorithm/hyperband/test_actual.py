@@ -0,0 +1,76 @@
+import pytest
+
+from lighttuner.hpo import uniform, quniform, R, hpo, M
+from ....testing import no_handlers
+
+
+@hpo
+def opt_func(v, budget):
+    x, y = v['x'], v['y']
+    return {
+        'result': x * y * budget / 27,  # low budget gives a biased estimation
+        'budget': budget,
+    }
+
+
+# noinspection DuplicatedCode
+@pytest.mark.unittest
+class TestHpoAlgorithmHyperbandActual:
+
+    @pytest.mark.flaky(reruns=3)
+    @no_handlers()
+    def test_hyperband_single_maximize(self):
+        cfg, res, metrics = opt_func.hyperband() \
+            .budget(1, 27) \
+            .eta(3) \
+            .max_workers(4) \
+            .maximize(R['result']) \
+            .concern(M['time'], 'time_cost') \
+            .concern(R['budget'], 'budget') \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['budget'] == 27
+        assert res['result'] >= 2400
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    @pytest.mark.flaky(reruns=3)
+    def test_hyperband_single_minimize_with_max_steps(self):
+        cfg, res, metrics = opt_func.hyperband(silent=True) \
+            .max_steps(60) \
+            .seed(0) \
+            .budget(1, 27) \
+            .minimize(R['result']) \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['result'] < 0
+
+    @pytest.mark.flaky(reruns=3)
+    def test_bohb_single_maximize(self):
+        cfg, res, metrics = opt_func.bohb(silent=True) \
+            .budget(1, 27) \
+            .set_parzen(gamma=0.2, n_candidates=32) \
+            .max_workers(4) \
+            .maximize(R['result']) \
+            .concern(R['budget'], 'budget') \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['budget'] == 27
+        assert res['result'] >= 2700
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    def test_hyperband_invalid(self):
+        with pytest.raises(ValueError):
+            opt_func.hyperband(silent=True).budget(5, 1).maximize(R['result']) \
+                .spaces({'x': uniform(-55, 125), 'y': uniform(-60, 20)}).run()
@@ -0,0 +1,39 @@
+import pytest
+
+from lighttuner.hpo.algorithm import HyperbandAlgorithm, BOHBAlgorithm
+from lighttuner.hpo.algorithm.hyperband import hyperband_brackets
+
+
+# noinspection DuplicatedCode
+@pytest.mark.unittest
+class TestHpoAlgorithmHyperbandAlgorithm:
+
+    def test_name(self):
+        assert HyperbandAlgorithm.algorithm_name() == 'hyperband algorithm'
+        assert BOHBAlgorithm.algorithm_name() == 'bohb algorithm'
+
+    def test_brackets(self):
+        assert hyperband_brackets(1, 81, 3) == [
+            [(81, 1), (27, 3), (9, 9), (3, 27), (1, 81)],
+            [(34, 3), (11, 9), (3, 27), (1, 81)],
+            [(15, 9), (5, 27), (1, 81)],
+            [(8, 27), (2, 81)],
+            [(5, 81)],
+        ]
+        assert hyperband_brackets(0.5, 2.0, 2) == [
+            [(4, 0.5), (2, 1.0), (1, 2.0)],
+            [(3, 1.0), (1, 2.0)],
+            [(3, 2.0)],
+        ]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            HyperbandAlgorithm('maximize', min_budget=0)
+        with pytest.raises(ValueError):
+            HyperbandAlgorithm('maximize', min_budget=10, max_budget=5)
+        with pytest.raises(ValueError):
+            HyperbandAlgorithm('maximize', eta=1)
+        with pytest.raises(ValueError):
+            BOHBAlgorithm('maximize', gamma=1.5)
+        with pytest.raises(ValueError):
+            BOHBAlgorithm('maximize', random_fraction=-0.1)
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from lighttuner.hpo import uniform, quniform, choice, R, hpo, M
+from ..public import get_hpo_func, EPS
+from ....testing import no_handlers
+
+
+@hpo
+def opt_func(v):
+    x, y = v['x'], v['y']
+    if random.random() < 0.45:
+        raise ValueError('Fxxk this shxt')  # retry is supported
+
+    return {
+        'result': x * y,
+        'sum': x + y,
+    }
+
+
+# noinspection DuplicatedCode
+@pytest.mark.unittest
+class TestHpoAlgorithmTPEActual:
+
+    @pytest.mark.flaky(reruns=3)
+    @no_handlers()
+    def test_tpe_single_maximize(self):
+        cfg, res, metrics = opt_func.tpe() \
+            .max_steps(200) \
+            .maximize(R['result']) \
+            .concern(M['time'], 'time_cost') \
+            .concern(R['sum'], 'sum') \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 0, 10),  # integer based space
+            }).run()
+
+        assert res['result'] >= 2800
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    @pytest.mark.flaky(reruns=3)
+    def test_tpe_single_minimize(self):
+        cfg, res, metrics = opt_func.tpe(silent=True) \
+            .max_steps(200) \
+            .init_steps(20) \
+            .set_parzen(gamma=0.2, n_candidates=32) \
+            .minimize(R['result']) \
+            .spaces(
+            {
+                'x': uniform(-55, 125),  # continuous space
+                'y': quniform(-60, 20, 10),  # integer based space
+            }).run()
+
+        assert res['result'] <= -7000
+        assert res['result'] == pytest.approx(cfg['x'] * cfg['y'])
+
+    def test_tpe_all(self):
+        visited, func = get_hpo_func()
+        cfg, res, metrics = func.tpe(silent=True).max_steps(200).maximize(R['result']).spaces(
+            {
+                'x': uniform(-2, 8),
+                'y': quniform(-1.6, 7.8, 0.2),
+                'z': choice(['a', 'b', 'c'])
+            }
+        ).run()
+
+        assert len(visited) == 200
+        for item in visited:
+            assert -2 <= item['x'] <= 8
+            assert -1.6 - EPS <= item['y'] <= 7.8 + EPS
+            index = (item['y'] - (-1.6)) / 0.2
+            assert abs(round(index) - index) == pytest.approx(0.0)
+            assert item['z'] in {'a', 'b', 'c'}
+        assert res['result'] >= 55
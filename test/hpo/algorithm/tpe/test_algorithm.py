@@ -0,0 +1,17 @@
+import pytest
+
+from lighttuner.hpo.algorithm import TPEAlgorithm
+
+
+# noinspection DuplicatedCode
+@pytest.mark.unittest
+class TestHpoAlgorithmTPEAlgorithm:
+
+    def test_name(self):
+        assert TPEAlgorithm.algorithm_name() == 'tpe algorithm'
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            TPEAlgorithm('maximize', gamma=1.5)
+        with pytest.raises(ValueError):
+            TPEAlgorithm('maximize', n_candidates=0)
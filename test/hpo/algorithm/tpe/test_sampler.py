@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from lighttuner.hpo.algorithm.tpe import ParzenSampler, vector_to_space_value
+from lighttuner.hpo.space import ContinuousSpace, SeparateSpace, FixedSpace
+
+
+# noinspection DuplicatedCode
+@pytest.mark.unittest
+class TestHpoAlgorithmTPESampler:
+
+    def test_sample_prior(self):
+        sampler = ParzenSampler(
+            (ContinuousSpace(-2, 8), SeparateSpace(-1.6, 7.8, 0.2), FixedSpace(3)),
+            random_state=np.random.RandomState(0),
+        )
+        assert sampler.dim == 3
+        for _ in range(100):
+            x = sampler.sample_prior()
+            assert -2 <= x[0] <= 8
+            assert x[1] in set(range(48))
+            assert x[2] in {0, 1, 2}
+
+    def test_suggest(self):
+        spaces = (ContinuousSpace(-2, 8), SeparateSpace(0, 10, 1), FixedSpace(4))
+        sampler = ParzenSampler(spaces, random_state=np.random.RandomState(0))
+        assert sampler.suggest(np.empty((0, 3)), np.empty(0)).shape == (3, )
+
+        def _loss(x):
+            return (x[0] - 5.0) ** 2 + (x[1] - 3) ** 2 + (0.0 if x[2] == 2 else 10.0)
+
+        xs = [sampler.sample_prior() for _ in range(20)]
+        for _ in range(100):
+            xs.append(sampler.suggest(np.array(xs), np.array([_loss(x) for x in xs])))
+
+        for x in xs:
+            assert -2 <= x[0] <= 8
+            assert x[1] in set(range(11))
+            assert x[2] in {0, 1, 2, 3}
+        best = min(xs, key=_loss)
+        assert _loss(best) < 1.0
+        assert np.mean([x[2] == 2 for x in xs[-50:]]) >= 0.5
+
+    def test_vector_to_space_value(self):
+        assert vector_to_space_value(ContinuousSpace(-2, 8), 1.5) == pytest.approx(1.5)
+        assert vector_to_space_value(SeparateSpace(-1.6, 7.8, 0.2), 3.0) == pytest.approx(-1.0)
+        assert vector_to_space_value(FixedSpace(3), 2.0) == 2
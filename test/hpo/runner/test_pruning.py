@@ -0,0 +1,64 @@
+import pytest
+
+from lighttuner.hpo import Prune, hpo, R, uniform
+from lighttuner.hpo.runner import ASHAPruner, Reporter
+from ...testing import no_handlers
+
+
+# noinspection DuplicatedCode
+@pytest.mark.unittest
+class TestHpoRunnerPruning:
+
+    def test_asha_pruner(self):
+        pruner = ASHAPruner('maximize', min_resource=2, reduction_factor=2)
+        assert [pruner.rung_resource(i) for i in range(4)] == [2, 4, 8, 16]
+
+        assert not pruner.should_prune(1, 1, 0.0)  # no rung reached
+        assert not pruner.should_prune(1, 2, 1.0)  # first in rung 0
+        assert not pruner.should_prune(2, 2, 2.0)  # better one
+        assert pruner.should_prune(3, 2, 0.5)  # worst one of 3 values
+        assert not pruner.should_prune(4, 2, 3.0)
+        assert pruner.should_prune(5, 4, 0.0)  # rung 0 and rung 1 reached at the same time
+        assert not pruner.should_prune(1, 4, 1.0)  # first in rung 1
+
+        pruner = ASHAPruner('minimize', min_resource=1, reduction_factor=3, min_early_stopping_rate=1)
+        assert pruner.rung_resource(0) == 3
+        assert not pruner.should_prune(1, 3, 1.0)
+        assert not pruner.should_prune(2, 3, 0.5)
+        assert pruner.should_prune(3, 3, 2.0)
+
+    def test_asha_pruner_invalid(self):
+        with pytest.raises(ValueError):
+            ASHAPruner('maximize', min_resource=0)
+        with pytest.raises(ValueError):
+            ASHAPruner('maximize', reduction_factor=1)
+        with pytest.raises(ValueError):
+            ASHAPruner('maximize', min_early_stopping_rate=-1)
+
+    def test_reporter(self):
+        pruner = ASHAPruner('maximize', min_resource=1, reduction_factor=2)
+        r1, r2 = Reporter(1, pruner), Reporter(2, pruner)
+        r1(1.0)
+        r1.report(2.0)
+        assert r1.last_step == 2
+        r2(float('nan'))  # nan is ignored
+        with pytest.raises(Prune) as ei:
+            r2(0.0, step=2)
+        assert ei.value.args == (2, 0.0)
+
+    @no_handlers()
+    def test_asha_logging(self):
+
+        @hpo
+        def opt_func(v, reporter):
+            for epoch in range(1, 10):
+                reporter(-abs(v['x'] - 1.0) * epoch)
+            return v['x']
+
+        cfg, res, metrics = opt_func.random() \
+            .max_steps(30) \
+            .max_workers(2) \
+            .asha(min_resource=1, reduction_factor=3) \
+            .maximize(R) \
+            .spaces({'x': uniform(0, 2)}).run()
+        assert res == pytest.approx(cfg['x'])
@@ -1,3 +1,4 @@
+import os
 from typing import Any, Tuple, Iterable
 
 import pytest
@@ -5,7 +6,7 @@ import pytest
 from lighttuner.hpo import uniform, Skip
 from lighttuner.hpo.algorithm import BaseAlgorithm, BaseSession, Task
 from lighttuner.hpo.runner.event import RunnerEventSet
-from lighttuner.hpo.runner.model import R, RunSkipped, RunFailed, RunResult
+from lighttuner.hpo.runner.model import R, RunSkipped, RunFailed, RunResult, RunPruned
 from lighttuner.hpo.runner.result import _ResultExpression
 from lighttuner.hpo.runner.runner import ParallelSearchRunner
 from lighttuner.hpo.utils import ThreadService, RankList, ServiceNoLongerAccept
@@ -87,6 +88,25 @@ class _MyEventSet(RunnerEventSet):
         self.complete_count += 1
 
 
+class _MyPruneEventSet(_MyEventSet):
+
+    def __init__(self):
+        _MyEventSet.__init__(self)
+        self.prune_count = 0
+        self.try_prune_count = 0
+        self.ranklists = []
+
+    def step_prune(self, task: Task, error: RunPruned):
+        self.prune_count += 1
+
+    def step_final(self, task: Task, ranklist: RankList):
+        _MyEventSet.step_final(self, task, ranklist)
+        self.ranklists.append(list(ranklist))
+
+    def try_prune(self, task: Task, try_id: int, max_try: int, step: int, value: float, metrics):
+        self.try_prune_count += 1
+
+
 # noinspection DuplicatedCode
 @pytest.mark.unittest
 class TestHpoRunnerRunner:
@@ -247,3 +267,111 @@ class TestHpoRunnerRunner:
         _my_event = _MyEventSet()
         with pytest.raises(ValueError):
             _return = runner.max_workers('dfksj')
+
+    def test_process_backend(self):
+
+        def _my_func(v):
+            a, (b0, b1) = v['a'], v['b']
+            if a % 3 == 0:
+                raise ValueError(f'Invalid a - {a}', a)
+            elif a % 7 == 0:
+                raise Skip('skipped', a)
+            else:
+                return {
+                    'result': (a - 32.8) ** 2,
+                    'sum': a + b0 + b1,
+                    'pid': os.getpid(),
+                }
+
+        runner = ParallelSearchRunner(_MyAlgorithm, _my_func, silent=True)
+        _my_event = _MyEventSet()
+        _cfg, _res, _metrics = runner \
+            .add_event_set(_my_event) \
+            .backend('process') \
+            .max_workers(4) \
+            .minimize(R['result']) \
+            .v(40) \
+            .spaces({
+                'a': uniform(0, 10),  # these uniform spaces are only placeholders here
+                'b': (
+                    uniform(0, 10),
+                    uniform(0, 10),
+                )
+            }).run()
+
+        assert _cfg == {'a': 32, 'b': (32, 32)}
+        assert _res['result'] == pytest.approx(0.64)
+        assert _res['sum'] == 96
+        assert _res['pid'] != os.getpid()
+        assert 'time' in _metrics
+
+        assert _my_event.step_count == 40
+        assert _my_event.ok_count == 22
+        assert _my_event.fail_count == 14
+        assert _my_event.skip_count == 4
+        assert _my_event.complete_count == 40
+
+    def test_invalid_backend(self):
+        runner = ParallelSearchRunner(_MyAlgorithm, lambda v: v, silent=True)
+        with pytest.raises(ValueError):
+            runner.backend('coroutine')
+
+    def test_asha(self):
+
+        def _my_func(v, reporter):
+            a, (b0, b1) = v['a'], v['b']
+            value = None
+            for epoch in range(1, 28):
+                value = -abs(a - 20) * epoch
+                reporter(value)
+            return {'result': value, 'sum': a + b0 + b1}
+
+        runner = ParallelSearchRunner(_MyAlgorithm, _my_func, silent=True)
+        _my_event = _MyPruneEventSet()
+        _cfg, _res, _metrics = runner \
+            .add_event_set(_my_event) \
+            .maximize(R['result']) \
+            .asha(min_resource=1, reduction_factor=3) \
+            .max_workers(1) \
+            .v(40) \
+            .spaces({
+                'a': uniform(0, 10),  # these uniform spaces are only placeholders here
+                'b': (
+                    uniform(0, 10),
+                    uniform(0, 10),
+                )
+            }).run()
+
+        assert _cfg == {'a': 20, 'b': (20, 20)}
+        assert _res == {'result': 0, 'sum': 60}
+        assert _my_event.step_count == 40
+        assert _my_event.prune_count >= 10
+        assert _my_event.ok_count + _my_event.prune_count == 40
+        assert _my_event.try_prune_count == _my_event.prune_count
+        assert all(len(ranklist) <= _my_event.ok_count for ranklist in _my_event.ranklists)
+
+    def test_asha_with_task_id(self):
+
+        def _my_func(v, task_id, reporter):
+            reporter(-task_id, step=5)
+            return task_id
+
+        runner = ParallelSearchRunner(_MyAlgorithm, _my_func, silent=True)
+        _cfg, _res, _metrics = runner \
+            .minimize(R) \
+            .asha(min_resource=5, reduction_factor=2) \
+            .max_workers(1) \
+            .v(10) \
+            .spaces({'a': uniform(0, 10)}).run()
+
+        assert _cfg == {'a': 0}
+        assert _res == 1
+
+    def test_asha_invalid(self):
+        runner = ParallelSearchRunner(_MyAlgorithm, lambda v: v, silent=True)
+        with pytest.raises(ValueError):
+            runner.asha().backend('process').maximize(R).v(10).spaces({'a': uniform(0, 10)}).run()
+
+        runner = ParallelSearchRunner(_MyAlgorithm, lambda v: v, silent=True)
+        with pytest.raises(ValueError):
+            runner.asha(reduction_factor=1).maximize(R).v(10).spaces({'a': uniform(0, 10)}).run()